@@ -0,0 +1,110 @@
+"""Helpers shared by the catalog enrichment scripts.
+
+Imported the same way as table_registry (``scripts/`` on ``sys.path``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import textwrap
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TypeVar
+
+# The libyaml-backed loader parses several times faster than the pure-Python
+# one; PyYAML wheels ship with it, source builds need libyaml installed.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml bindings not available
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+
+def write_atomic(path: Path, content: bytes) -> None:
+    """Write to a sibling temp file and move it over ``path``.
+
+    The content goes out in a single write, and an interrupted or failed
+    write never leaves a truncated file (or a stray temp file) behind.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def index_by_name(entries: list[dict]) -> dict[str, dict]:
+    """Map each entry's ``name`` to the entry; the first one wins on duplicates.
+
+    Used to look metadata tables/trade types up by name once per run instead
+    of scanning the metadata lists for every table.
+    """
+    by_name: dict[str, dict] = {}
+    for entry in entries:
+        by_name.setdefault(entry.get("name"), entry)
+    return by_name
+
+
+def wrap_words(
+    text: str, first_prefix: str, continuation: str, width: int = 120
+) -> list[str]:
+    """Greedily word-wrap text, one space between words, never splitting words.
+
+    The first line starts with ``first_prefix`` and later ones with
+    ``continuation``; both count towards ``width``.
+    """
+    return textwrap.wrap(
+        " ".join(text.split()),
+        width=width,
+        initial_indent=first_prefix,
+        subsequent_indent=continuation,
+        break_long_words=False,
+        break_on_hyphens=False,
+    )
+
+
+def map_tables(
+    fn: Callable[..., T],
+    jobs: Sequence[tuple],
+    workers: int | None = 1,
+    *,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+) -> Iterator[T]:
+    """Yield ``fn(*job)`` for each job, in input order.
+
+    Each job touches its own table file, so with ``workers`` > 1 (``None``
+    means CPU count) the jobs are spread over a process pool. State shared by
+    every job goes through ``initializer(*initargs)``, which runs once per
+    worker rather than being pickled with each job. With one worker (or one
+    job) everything runs serially in this process, ``initializer`` included.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for job in jobs:
+            yield fn(*job)
+        return
+
+    workers = min(workers, len(jobs))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as executor:
+        yield from executor.map(
+            fn, *zip(*jobs), chunksize=max(1, len(jobs) // (workers * 4))
+        )
+
+
+def add_workers_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the ``--workers`` option; unset means one process per CPU."""
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for per-table work (default: CPU count; 1 = serial)",
+    )
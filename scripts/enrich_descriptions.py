@@ -17,11 +17,22 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
+import io
 import re
+import sys
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
 import yaml
+from enrich_common import (
+    SafeLoader,
+    add_workers_argument,
+    map_tables,
+    wrap_words,
+    write_atomic,
+)
 from table_registry import (
     ALL_TABLES,
     MARKET_TABLES,
@@ -45,12 +56,60 @@ KPI_DIR = CATALOG_DIR / "kpi"
 COPY_FIELDS = ["description", "source", "synonyms", "business_rules", "related_columns"]
 
 
+# ---------------------------------------------------------------------------
+# YAML loading
+# ---------------------------------------------------------------------------
+
+
+def _load_yaml(path: Path) -> Any:
+    """Parse a YAML file with the libyaml loader, streaming it as bytes.
+
+    Not cached: table YAMLs are rewritten by this script and must always be
+    read fresh; the metadata/ inputs are cached by their own loaders.
+    """
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
 # ---------------------------------------------------------------------------
 # Tier 1: OMX/KPI Reference Builder
 # ---------------------------------------------------------------------------
 
 
-def build_omx_reference() -> dict[str, dict[str, dict[str, Any]]]:
+def _reference_columns(yaml_path: Path) -> tuple[str, dict[str, dict[str, Any]]]:
+    """Extract (table_name, {col_name: col_meta}) from one reference YAML.
+
+    Only columns with a non-empty description are kept; empty COPY_FIELDS
+    values are dropped from each column's metadata.
+    """
+    data = _load_yaml(yaml_path)
+    table = data.get("table", {})
+    table_name = table.get("name", yaml_path.stem)
+    columns: dict[str, dict[str, Any]] = {}
+
+    for col in table.get("columns", []):
+        col_name = col["name"]
+        desc = col.get("description", "")
+        if not desc or str(desc).strip() == "":
+            continue  # skip empty descriptions in reference
+
+        # Keep only non-empty values (falsy or whitespace-only strings)
+        col_meta = {
+            field: val
+            for field in COPY_FIELDS
+            if (val := col.get(field)) and not (isinstance(val, str) and val.isspace())
+        }
+
+        # Only store if we have a description
+        if "description" in col_meta:
+            columns[col_name] = col_meta
+
+    return table_name, columns
+
+
+def build_omx_reference(
+    workers: int | None = 1,
+) -> dict[str, dict[str, dict[str, Any]]]:
     """Build mapping of (table_base_name, column_name) -> column metadata.
 
     Reads enriched YAMLs from catalog/data/ and catalog/kpi/ to serve as
@@ -59,47 +118,37 @@ def build_omx_reference() -> dict[str, dict[str, dict[str, Any]]]:
     KPI tables are included because some columns (like KPI-specific metrics)
     only appear in the KPI layer. Data-layer columns take priority when both
     exist (data descriptions tend to be more specific about the raw data).
-    """
-    reference: dict[str, dict[str, dict[str, Any]]] = {}
 
+    The files are parsed independently, so with ``workers`` > 1 (``None``
+    means CPU count) they are spread over a process pool; the merge always
+    runs here, in file order. The default of 1 parses serially.
+    """
+    ref_paths: list[tuple[Path, bool]] = []
     for ref_dir in [OMX_DATA_DIR, KPI_DIR]:
         if not ref_dir.exists():
             continue
         for yaml_path in sorted(ref_dir.glob("*.yaml")):
             if yaml_path.name.startswith("_"):
                 continue
-            data = yaml.safe_load(yaml_path.read_text())
-            table = data.get("table", {})
-            table_name = table.get("name", yaml_path.stem)
-
-            if table_name not in reference:
-                reference[table_name] = {}
-
-            for col in table.get("columns", []):
-                col_name = col["name"]
-                desc = col.get("description", "")
-                if not desc or str(desc).strip() == "":
-                    continue  # skip empty descriptions in reference
-
-                col_meta: dict[str, Any] = {}
-                for field in COPY_FIELDS:
-                    if col.get(field):
-                        val = col[field]
-                        # Skip empty values
-                        if isinstance(val, str) and val.strip() == "":
-                            continue
-                        if isinstance(val, list) and len(val) == 0:
-                            continue
-                        col_meta[field] = val
-
-                # Only store if we have a description
-                if "description" in col_meta:
-                    # Data-layer overwrites KPI-layer for same column
-                    if col_name not in reference[table_name]:
-                        reference[table_name][col_name] = col_meta
-                    elif ref_dir == OMX_DATA_DIR:
-                        # Data dir takes precedence
-                        reference[table_name][col_name] = col_meta
+            ref_paths.append((yaml_path, ref_dir == OMX_DATA_DIR))
+
+    parsed = map_tables(_reference_columns, [(p,) for p, _ in ref_paths], workers)
+    return _merge_reference(ref_paths, parsed)
+
+
+def _merge_reference(
+    ref_paths: list[tuple[Path, bool]],
+    parsed: Iterator[tuple[str, dict[str, dict[str, Any]]]],
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Merge per-file reference columns; data-layer columns win over KPI."""
+    reference: dict[str, dict[str, dict[str, Any]]] = {}
+
+    for (_, is_data_dir), (table_name, columns) in zip(ref_paths, parsed, strict=True):
+        ref_table = reference.setdefault(table_name, {})
+        for col_name, col_meta in columns.items():
+            # Data-layer overwrites KPI-layer for same column
+            if is_data_dir or col_name not in ref_table:
+                ref_table[col_name] = col_meta
 
     return reference
 
@@ -108,26 +157,28 @@ def build_omx_reference() -> dict[str, dict[str, dict[str, Any]]]:
 # Tier 2: Proto/Transform Mapping
 # ---------------------------------------------------------------------------
 
+# The metadata/ loaders are cached: those files are inputs only (no enrichment
+# script writes them), so repeated main() calls in one process parse them once.
+# build_omx_reference is not cached because it reads the catalog being edited.
+# Callers must treat the returned structures as read-only.
 
-def _load_proto_fields() -> dict[str, list[dict[str, Any]]]:
-    """Load proto_fields.yaml and return {message_name: [field_dicts]}."""
-    path = METADATA_DIR / "proto_fields.yaml"
-    if not path.exists():
-        return {}
-    data = yaml.safe_load(path.read_text())
-    result: dict[str, list[dict[str, Any]]] = {}
-    for msg in data.get("messages", []):
-        result[msg["name"]] = msg.get("fields", [])
-    return result
 
+@functools.lru_cache(maxsize=1)
+def _load_proto_yaml() -> tuple[
+    dict[str, list[dict[str, Any]]], dict[str, dict[str, Any]]
+]:
+    """Load proto_fields.yaml once.
 
-def _load_proto_to_bq() -> dict[str, dict[str, Any]]:
-    """Load the proto_to_bq section from proto_fields.yaml."""
+    Returns ({message_name: [field_dicts]}, proto_to_bq section).
+    """
     path = METADATA_DIR / "proto_fields.yaml"
     if not path.exists():
-        return {}
-    data = yaml.safe_load(path.read_text())
-    return data.get("proto_to_bq", {})
+        return {}, {}
+    data = _load_yaml(path)
+    messages: dict[str, list[dict[str, Any]]] = {}
+    for msg in data.get("messages", []):
+        messages[msg["name"]] = msg.get("fields", [])
+    return messages, data.get("proto_to_bq", {})
 
 
 def build_proto_description_map(
@@ -140,14 +191,19 @@ def build_proto_description_map(
     """
     result: dict[str, dict[str, Any]] = {}
 
+    # Names and comments are interned: field names are probed for every
+    # column, and the same comment text recurs across messages
     for msg_name, fields in proto_messages.items():
+        msg_name = sys.intern(msg_name)
         for field in fields:
             fname = field["name"]
+            if isinstance(fname, str):
+                fname = sys.intern(fname)
             comment = field.get("comment", "").strip()
             if not comment:
                 continue  # no description to use
             entry = {
-                "comment": comment,
+                "comment": sys.intern(comment),
                 "type": field.get("type", ""),
                 "message": msg_name,
             }
@@ -161,12 +217,13 @@ def build_proto_description_map(
     return result
 
 
+@functools.lru_cache(maxsize=1)
 def _load_transforms() -> dict[str, list[dict[str, Any]]]:
     """Load data_loader_transforms.yaml and return {table_name: [column_dicts]}."""
     path = METADATA_DIR / "data_loader_transforms.yaml"
     if not path.exists():
         return {}
-    data = yaml.safe_load(path.read_text())
+    data = _load_yaml(path)
     result: dict[str, list[dict[str, Any]]] = {}
     for table in data.get("tables", []):
         result[table["name"]] = table.get("columns", [])
@@ -195,13 +252,9 @@ def build_transform_map(
                 parts = proto_field.split(".")
                 proto_field = parts[-1]
 
-            # Strip _name suffix for enum name extractions
-            clean_proto_field = proto_field
-            if clean_proto_field.endswith("_name"):
-                clean_proto_field = clean_proto_field[: -len("_name")]
-            if clean_proto_field.endswith("_ns"):
-                # Nanosecond variant: the base field is the one without _ns
-                clean_proto_field = clean_proto_field[: -len("_ns")]
+            # Strip _name suffix for enum name extractions; for the nanosecond
+            # variant the base field is the one without _ns
+            clean_proto_field = proto_field.removesuffix("_name").removesuffix("_ns")
 
             table_map[bq_name] = {
                 "source_field": source_field,
@@ -215,8 +268,12 @@ def build_transform_map(
     return result
 
 
+@functools.cache
 def _snake_to_camel(name: str) -> str:
-    """Convert snake_case to camelCase for proto field lookup."""
+    """Convert snake_case to camelCase for proto field lookup.
+
+    Cached: the same column names recur in every market.
+    """
     parts = name.split("_")
     return parts[0] + "".join(p.capitalize() for p in parts[1:])
 
@@ -231,11 +288,10 @@ def _build_tier2_description(
 ) -> str | None:
     """Try to build a description from proto comment + transform context."""
     # Find the transform entry for this column
-    t_info = None
-    for tbl in transform_map:
-        if tbl == table_name and col_name in transform_map[tbl]:
-            t_info = transform_map[tbl][col_name]
-            break
+    t_info = transform_map.get(table_name, {}).get(col_name)
+    stem, has_sep, suffix = col_name.rpartition("_")
+    if not has_sep:
+        suffix = ""
 
     proto_field = None
     proto_field_clean = None
@@ -263,21 +319,17 @@ def _build_tier2_description(
         camel = _snake_to_camel(col_name)
         # Also try stripping _name / _ns suffixes
         camel_clean = camel
-        if col_name.endswith("_name"):
-            camel_clean = _snake_to_camel(col_name[:-5])
-        elif col_name.endswith("_ns"):
-            camel_clean = _snake_to_camel(col_name[:-3])
-
-        # Check if there's a proto field match
-        candidates = [camel, camel_clean, col_name]
-        found = False
-        for c in candidates:
+        if suffix in ("name", "ns"):
+            camel_clean = _snake_to_camel(stem)
+
+        # Check if there's a proto field match; dict.fromkeys drops repeated
+        # candidates (no suffix stripped, or a single-word name) in order
+        for c in dict.fromkeys((camel, camel_clean, col_name)):
             if c in proto_desc_map:
                 proto_field = c
                 proto_field_clean = c
-                found = True
                 break
-        if not found:
+        else:
             return None
 
     # Look up proto comment
@@ -312,12 +364,11 @@ def _build_tier2_description(
         desc += f" From {message_name} proto."
 
     # Add nanosecond precision note for _ns columns
-    if col_name.endswith("_ns"):
-        base_col = col_name[:-3]
-        desc = f"Nanosecond-precision component of {base_col.replace('_', ' ')}. {desc}"
+    if suffix == "ns":
+        desc = f"Nanosecond-precision component of {stem.replace('_', ' ')}. {desc}"
 
     # Add enum/human-readable name note for _name columns
-    if col_name.endswith("_name"):
+    if suffix == "name":
         is_enum_note = t_info and t_info.get("notes", "").startswith("enum")
         # If description was inherited from the base field (without _name),
         # add context that this is the human-readable name
@@ -333,472 +384,365 @@ def _build_tier2_description(
 # Tier 3: Name-Pattern Heuristic
 # ---------------------------------------------------------------------------
 
-# Map of column name patterns to description generators
-_PATTERN_DESCRIPTIONS: list[tuple[str, str]] = [
+# Exact column names mapped to their descriptions
+_PATTERN_DESCRIPTIONS: dict[str, str] = {
     # Kafka infrastructure
-    (
-        "kafka_message_timestamp",
-        "Kafka ingestion timestamp recording when this message was produced to the Kafka topic. Used internally for data pipeline monitoring and replay.",
-    ),
-    (
-        "record_written_timestamp",
-        "Timestamp when this record was written to the data warehouse by the data pipeline. Used for tracking data freshness and pipeline latency.",
-    ),
-    (
-        "kafka_partition",
-        "Kafka partition number from which this record was consumed. Used internally for data pipeline tracking and replay.",
-    ),
-    (
-        "kafka_offset",
-        "Kafka offset of the record within its partition. Used for exactly-once processing guarantees and data pipeline replay.",
-    ),
-    (
-        "partition_timestamp_local",
-        "Local-timezone timestamp of the data partition. Used for partition-level data management in the pipeline.",
-    ),
-    (
-        "partition_number",
-        "Numeric partition identifier within the data pipeline. Used for data distribution and parallel processing.",
-    ),
+    "kafka_message_timestamp": "Kafka ingestion timestamp recording when this message was produced to the Kafka topic. Used internally for data pipeline monitoring and replay.",
+    "record_written_timestamp": "Timestamp when this record was written to the data warehouse by the data pipeline. Used for tracking data freshness and pipeline latency.",
+    "kafka_partition": "Kafka partition number from which this record was consumed. Used internally for data pipeline tracking and replay.",
+    "kafka_offset": "Kafka offset of the record within its partition. Used for exactly-once processing guarantees and data pipeline replay.",
+    "partition_timestamp_local": "Local-timezone timestamp of the data partition. Used for partition-level data management in the pipeline.",
+    "partition_number": "Numeric partition identifier within the data pipeline. Used for data distribution and parallel processing.",
     # Common identifiers
-    (
-        "instrument_hash",
-        "Unique SHA256 hash identifier for the instrument, deterministically computed from the instrument defining attributes. Used as the primary join key across all data and KPI tables.",
-    ),
-    (
-        "trade_date",
-        "Trading session date used as the partition column. Always filter on this field for efficient queries.",
-    ),
+    "instrument_hash": "Unique SHA256 hash identifier for the instrument, deterministically computed from the instrument defining attributes. Used as the primary join key across all data and KPI tables.",
+    "trade_date": "Trading session date used as the partition column. Always filter on this field for efficient queries.",
     # Common VtCommon fields
-    ("portfolio", "Name of the Mako portfolio to which the trading algorithm belongs."),
-    ("algo", "Name of the originating trading algorithm or strategy."),
-    ("symbol", "Mako symbol identifier for the traded instrument."),
+    "portfolio": "Name of the Mako portfolio to which the trading algorithm belongs.",
+    "algo": "Name of the originating trading algorithm or strategy.",
+    "symbol": "Mako symbol identifier for the traded instrument.",
     # Instrument enrichment columns
-    (
-        "mako_symbol",
-        "Mako-internal symbol identifier, enriched from the instruments reference table via instrument_hash join.",
-    ),
-    (
-        "currency",
-        "Currency code for the instrument, enriched from the instruments reference table.",
-    ),
-    (
-        "inst_type_name",
-        "Human-readable instrument type name (e.g. option, future, stock), enriched from the instruments reference table.",
-    ),
-    (
-        "term",
-        "Expiry term/maturity label for the instrument, enriched from the instruments reference table.",
-    ),
-    (
-        "strike",
-        "Strike price for options, enriched from the instruments reference table. NULL for non-option instruments.",
-    ),
-    (
-        "option_type",
-        "Option type code (C=Call, P=Put), enriched from the instruments reference table. NULL for non-option instruments.",
-    ),
-    (
-        "option_type_name",
-        "Human-readable option type name (Call/Put), enriched from the instruments reference table.",
-    ),
-    (
-        "expiry_timestamp",
-        "Expiry timestamp for the instrument, enriched from the instruments reference table.",
-    ),
+    "mako_symbol": "Mako-internal symbol identifier, enriched from the instruments reference table via instrument_hash join.",
+    "currency": "Currency code for the instrument, enriched from the instruments reference table.",
+    "inst_type_name": "Human-readable instrument type name (e.g. option, future, stock), enriched from the instruments reference table.",
+    "term": "Expiry term/maturity label for the instrument, enriched from the instruments reference table.",
+    "strike": "Strike price for options, enriched from the instruments reference table. NULL for non-option instruments.",
+    "option_type": "Option type code (C=Call, P=Put), enriched from the instruments reference table. NULL for non-option instruments.",
+    "option_type_name": "Human-readable option type name (Call/Put), enriched from the instruments reference table.",
+    "expiry_timestamp": "Expiry timestamp for the instrument, enriched from the instruments reference table.",
     # Common timestamp fields
-    (
-        "event_timestamp",
-        "Timestamp of the event, recording when the VT processed this event.",
-    ),
-    (
-        "exchange_timestamp",
-        "Exchange-provided timestamp of when the event occurred on the exchange.",
-    ),
-    (
-        "hardware_nic_rx_timestamp",
-        "Hardware NIC receive timestamp, recording when the price packet arrived at the network card. Used for precise latency measurement.",
-    ),
+    "event_timestamp": "Timestamp of the event, recording when the VT processed this event.",
+    "exchange_timestamp": "Exchange-provided timestamp of when the event occurred on the exchange.",
+    "hardware_nic_rx_timestamp": "Hardware NIC receive timestamp, recording when the price packet arrived at the network card. Used for precise latency measurement.",
     # Common exchange/trade fields
-    (
-        "underlying_exe_exch",
-        "Numeric exchange code where the underlying instrument trades.",
-    ),
-    (
-        "base_valuation_type",
-        "Numeric code for the base valuation method used by the pricing model.",
-    ),
-    ("message_trade_date", "Trade date embedded within the original proto message."),
-    (
-        "edge",
-        "Edge (theoretical profit) seen on this trade, computed as the difference between theo value and trade price.",
-    ),
-    (
-        "contract_size",
-        "Number of units per contract lot. Streamed from TradableInstrument.contractSize proto field.",
-    ),
-    (
-        "raw_proto",
-        "Raw serialized protobuf bytes of the original message. Used for debugging and replay.",
-    ),
-    ("pid", "Process ID of the data source that produced this record."),
-    ("hostname", "Hostname of the data source that produced this record."),
+    "underlying_exe_exch": "Numeric exchange code where the underlying instrument trades.",
+    "base_valuation_type": "Numeric code for the base valuation method used by the pricing model.",
+    "message_trade_date": "Trade date embedded within the original proto message.",
+    "edge": "Edge (theoretical profit) seen on this trade, computed as the difference between theo value and trade price.",
+    "contract_size": "Number of units per contract lot. Streamed from TradableInstrument.contractSize proto field.",
+    "raw_proto": "Raw serialized protobuf bytes of the original message. Used for debugging and replay.",
+    "pid": "Process ID of the data source that produced this record.",
+    "hostname": "Hostname of the data source that produced this record.",
     # PositionEvent / trade management fields
-    ("mako_id", "Mako-internal unique identifier for this trade or order."),
-    ("algorithm", "Name of the Mako algorithm that generated this trade or event."),
-    ("order_id", "Mako-internal order identifier linking fills to the parent order."),
-    (
-        "fill_id",
-        "Unique identifier for this fill (partial or full execution) within an order.",
-    ),
-    ("transaction_id", "Mako-internal transaction identifier for this event."),
-    (
-        "exchange_transaction_id",
-        "Exchange-assigned transaction identifier for this event.",
-    ),
-    (
-        "position_type",
-        "Numeric code classifying the position event type (e.g. trade, adjustment, exercise).",
-    ),
-    (
-        "position_id",
-        "Identifier for the position this event belongs to within the portfolio.",
-    ),
-    ("traded_size", "Number of lots traded in this transaction."),
-    (
-        "total_traded_size",
-        "Cumulative number of lots traded across all fills for this order.",
-    ),
-    (
-        "company_position",
-        "Net company-wide position for this instrument after this event.",
-    ),
-    ("settlement", "Settlement price for the instrument."),
-    ("settlement_date", "Date on which settlement occurs for this trade."),
-    ("value_date", "Value date for the trade, relevant for settlement calculations."),
-    ("cash_value", "Cash value of this trade or position change."),
-    ("pos_value_currency", "Currency in which the position value is denominated."),
-    ("agg_pos_date", "Aggregated position date for end-of-day processing."),
-    (
-        "max_trade_id",
-        "Maximum trade ID in the batch, used for ordering and deduplication.",
-    ),
-    ("ectv", "Exchange-cleared theoretical value used for settlement calculations."),
-    ("routed_exchange", "Exchange to which this order was routed for execution."),
-    ("executable_exchange", "Exchange on which this instrument is executable."),
-    ("channel", "Data channel or feed identifier for this event."),
-    ("trade_id", "Exchange-assigned trade identifier."),
-    ("exchange_date", "Date as reported by the exchange for this event."),
-    (
-        "event_date",
-        "Date of the event, may differ from trade_date for overnight sessions.",
-    ),
+    "mako_id": "Mako-internal unique identifier for this trade or order.",
+    "algorithm": "Name of the Mako algorithm that generated this trade or event.",
+    "order_id": "Mako-internal order identifier linking fills to the parent order.",
+    "fill_id": "Unique identifier for this fill (partial or full execution) within an order.",
+    "transaction_id": "Mako-internal transaction identifier for this event.",
+    "exchange_transaction_id": "Exchange-assigned transaction identifier for this event.",
+    "position_type": "Numeric code classifying the position event type (e.g. trade, adjustment, exercise).",
+    "position_id": "Identifier for the position this event belongs to within the portfolio.",
+    "traded_size": "Number of lots traded in this transaction.",
+    "total_traded_size": "Cumulative number of lots traded across all fills for this order.",
+    "company_position": "Net company-wide position for this instrument after this event.",
+    "settlement": "Settlement price for the instrument.",
+    "settlement_date": "Date on which settlement occurs for this trade.",
+    "value_date": "Value date for the trade, relevant for settlement calculations.",
+    "cash_value": "Cash value of this trade or position change.",
+    "pos_value_currency": "Currency in which the position value is denominated.",
+    "agg_pos_date": "Aggregated position date for end-of-day processing.",
+    "max_trade_id": "Maximum trade ID in the batch, used for ordering and deduplication.",
+    "ectv": "Exchange-cleared theoretical value used for settlement calculations.",
+    "routed_exchange": "Exchange to which this order was routed for execution.",
+    "executable_exchange": "Exchange on which this instrument is executable.",
+    "channel": "Data channel or feed identifier for this event.",
+    "trade_id": "Exchange-assigned trade identifier.",
+    "exchange_date": "Date as reported by the exchange for this event.",
+    "event_date": "Date of the event, may differ from trade_date for overnight sessions.",
     # Common trading fields
-    ("price", "Price of the trade or order."),
-    ("size", "Number of lots or contracts in the trade or order."),
-    ("counterparty", "Counterparty identifier for this trade."),
-    ("broker", "Broker identifier associated with this trade."),
-    ("inventory", "Inventory account associated with this trade or position."),
-    ("account", "Account identifier for this trade."),
-    ("source", "Source system or feed that originated this record."),
-    ("trader_id", "Identifier of the trader responsible for this trade."),
-    (
-        "user_order_id",
-        "User-submitted order identifier linking back to the order entry system.",
-    ),
-    ("exchange_info", "Additional exchange-provided information for this event."),
-    (
-        "exchange_qualifier",
-        "Exchange qualifier code providing additional event context.",
-    ),
-    ("statistics", "Statistical summary or classification data for this event."),
-    (
-        "text",
-        "Free-text field containing additional descriptive information about this event.",
-    ),
-    ("revisor", "Identifier of the user or process that last revised this record."),
-    ("revision", "Revision number tracking modifications to this record."),
+    "price": "Price of the trade or order.",
+    "size": "Number of lots or contracts in the trade or order.",
+    "counterparty": "Counterparty identifier for this trade.",
+    "broker": "Broker identifier associated with this trade.",
+    "inventory": "Inventory account associated with this trade or position.",
+    "account": "Account identifier for this trade.",
+    "source": "Source system or feed that originated this record.",
+    "trader_id": "Identifier of the trader responsible for this trade.",
+    "user_order_id": "User-submitted order identifier linking back to the order entry system.",
+    "exchange_info": "Additional exchange-provided information for this event.",
+    "exchange_qualifier": "Exchange qualifier code providing additional event context.",
+    "statistics": "Statistical summary or classification data for this event.",
+    "text": "Free-text field containing additional descriptive information about this event.",
+    "revisor": "Identifier of the user or process that last revised this record.",
+    "revision": "Revision number tracking modifications to this record.",
     # Greeks and pricing
-    ("vol", "Implied volatility of the instrument at the time of this event."),
-    (
-        "delta",
-        "Option delta (rate of change of option price with respect to underlying price).",
-    ),
-    (
-        "gamma",
-        "Option gamma (rate of change of delta with respect to underlying price).",
-    ),
-    (
-        "vega",
-        "Option vega (sensitivity of option price to changes in implied volatility).",
-    ),
-    (
-        "theta",
-        "Option theta (time decay, rate of change of option price with respect to time).",
-    ),
-    ("rho", "Option rho (sensitivity of option price to changes in interest rates)."),
-    ("under", "Price of the underlying instrument at the time of this event."),
-    ("tte", "Time to expiry in years for the instrument."),
-    ("fwd", "Forward price of the underlying instrument."),
-    (
-        "curve_id",
-        "Identifier for the volatility/pricing curve used in theoretical calculations.",
-    ),
-    (
-        "carry_id",
-        "Identifier for the carry/interest rate curve used in theoretical calculations.",
-    ),
-    ("liquid", "Liquidity indicator or classification for the instrument."),
-    (
-        "deflection_scale",
-        "Scale factor for the deflection adjustment applied to pricing.",
-    ),
+    "vol": "Implied volatility of the instrument at the time of this event.",
+    "delta": "Option delta (rate of change of option price with respect to underlying price).",
+    "gamma": "Option gamma (rate of change of delta with respect to underlying price).",
+    "vega": "Option vega (sensitivity of option price to changes in implied volatility).",
+    "theta": "Option theta (time decay, rate of change of option price with respect to time).",
+    "rho": "Option rho (sensitivity of option price to changes in interest rates).",
+    "under": "Price of the underlying instrument at the time of this event.",
+    "tte": "Time to expiry in years for the instrument.",
+    "fwd": "Forward price of the underlying instrument.",
+    "curve_id": "Identifier for the volatility/pricing curve used in theoretical calculations.",
+    "carry_id": "Identifier for the carry/interest rate curve used in theoretical calculations.",
+    "liquid": "Liquidity indicator or classification for the instrument.",
+    "deflection_scale": "Scale factor for the deflection adjustment applied to pricing.",
     # Instrument fields
-    ("no_legs", "Number of legs in a combo/spread instrument."),
-    ("ratio", "Leg ratio within a combo instrument, indicating relative weighting."),
-    ("inst_type", "Numeric instrument type code."),
-    ("exercise_type", "Exercise type for options (European, American, etc.)."),
-    ("expiry_timezone", "Timezone of the instrument expiry."),
-    ("issue_date", "Issue date for bonds or newly listed instruments."),
-    ("coupon", "Coupon rate for bond instruments."),
-    (
-        "has_underlying",
-        "Boolean indicating whether this instrument has an underlying reference.",
-    ),
-    (
-        "payment_type",
-        "Payment type for the instrument (physical, cash settlement, etc.).",
-    ),
-    ("pricing_count", "Number of pricing inputs available for this instrument."),
+    "no_legs": "Number of legs in a combo/spread instrument.",
+    "ratio": "Leg ratio within a combo instrument, indicating relative weighting.",
+    "inst_type": "Numeric instrument type code.",
+    "exercise_type": "Exercise type for options (European, American, etc.).",
+    "expiry_timezone": "Timezone of the instrument expiry.",
+    "issue_date": "Issue date for bonds or newly listed instruments.",
+    "coupon": "Coupon rate for bond instruments.",
+    "has_underlying": "Boolean indicating whether this instrument has an underlying reference.",
+    "payment_type": "Payment type for the instrument (physical, cash settlement, etc.).",
+    "pricing_count": "Number of pricing inputs available for this instrument.",
     # Quoter fields
-    ("delete_side", "Side (BID/ASK) of the quote that was deleted."),
-    ("delete_type", "Type classification of the quote deletion event."),
-    (
-        "trigger_type",
-        "Type of trigger that caused the quote action (price move, risk event, etc.).",
-    ),
-    ("trigger_price", "Price level that triggered the quote action."),
-    ("active_price", "Current active price of the resting quote before the action."),
-    ("active_size", "Current active size of the resting quote before the action."),
-    ("update_type", "Type classification of the quote update event."),
-    (
-        "pull_restriction",
-        "Pull restriction level indicating the severity of quote withdrawal.",
-    ),
-    ("bucket", "Bucket or group identifier for the quoter event."),
-    ("max_placable", "Maximum placeable volume for the quoter at this level."),
-    ("currently_placed", "Volume currently placed by the quoter at this level."),
-    ("want_to_place", "Volume the quoter algorithm wants to place."),
-    ("refill_pct_rate", "Refill percentage rate for quote replenishment."),
-    ("max_edge_loss", "Maximum edge loss threshold for the BOSH order."),
-    ("edge_loss", "Realized edge loss on this order."),
-    ("edge_units", "Edge measurement units for this order."),
-    ("atm_vega", "At-the-money vega used for order sizing."),
-    ("base_atm_size", "Base ATM size parameter for order sizing."),
-    ("max_size_multiplier", "Maximum size multiplier for order scaling."),
-    ("order_option", "Order option type or configuration."),
-    (
-        "resting_time_limit_nanos",
-        "Time limit in nanoseconds for how long the order may rest.",
-    ),
-    ("side", "Side of the order or quote: BID (buy) or ASK (sell)."),
-    ("action", "Action type for order lifecycle events (new, modify, cancel, fill)."),
-    ("cancel_reason", "Reason code for order cancellation."),
-    ("residual_volume", "Remaining unfilled volume on the order."),
+    "delete_side": "Side (BID/ASK) of the quote that was deleted.",
+    "delete_type": "Type classification of the quote deletion event.",
+    "trigger_type": "Type of trigger that caused the quote action (price move, risk event, etc.).",
+    "trigger_price": "Price level that triggered the quote action.",
+    "active_price": "Current active price of the resting quote before the action.",
+    "active_size": "Current active size of the resting quote before the action.",
+    "update_type": "Type classification of the quote update event.",
+    "pull_restriction": "Pull restriction level indicating the severity of quote withdrawal.",
+    "bucket": "Bucket or group identifier for the quoter event.",
+    "max_placable": "Maximum placeable volume for the quoter at this level.",
+    "currently_placed": "Volume currently placed by the quoter at this level.",
+    "want_to_place": "Volume the quoter algorithm wants to place.",
+    "refill_pct_rate": "Refill percentage rate for quote replenishment.",
+    "max_edge_loss": "Maximum edge loss threshold for the BOSH order.",
+    "edge_loss": "Realized edge loss on this order.",
+    "edge_units": "Edge measurement units for this order.",
+    "atm_vega": "At-the-money vega used for order sizing.",
+    "base_atm_size": "Base ATM size parameter for order sizing.",
+    "max_size_multiplier": "Maximum size multiplier for order scaling.",
+    "order_option": "Order option type or configuration.",
+    "resting_time_limit_nanos": "Time limit in nanoseconds for how long the order may rest.",
+    "side": "Side of the order or quote: BID (buy) or ASK (sell).",
+    "action": "Action type for order lifecycle events (new, modify, cancel, fill).",
+    "cancel_reason": "Reason code for order cancellation.",
+    "residual_volume": "Remaining unfilled volume on the order.",
     # PCAP / Network fields
-    ("source_ip", "Source IP address of the captured network packet."),
-    ("source_port", "Source port of the captured network packet."),
-    ("destination_ip", "Destination IP address of the captured network packet."),
-    ("destination_port", "Destination port of the captured network packet."),
-    ("message_type", "Message type classification for the captured packet."),
-    (
-        "normalised_message_type",
-        "Normalised message type for cross-exchange comparison.",
-    ),
-    ("native_type", "Exchange-native message type code."),
-    ("channel_id", "Channel identifier for the data feed or connection."),
-    ("connection_kind", "Type of connection (TCP, UDP, multicast, etc.)."),
-    ("connection_feed", "Feed identifier for the market data connection."),
-    ("host", "Hostname of the network endpoint."),
-    ("port", "Port number of the network endpoint."),
-    ("spark_event_type", "Spark algorithm event type classification."),
-    ("native_event_type", "Exchange-native event type code."),
-    ("broker_name", "Name of the broker for this event."),
-    ("order_identifier", "Exchange or broker order identifier."),
-    ("exchange_order_id", "Exchange-assigned order identifier."),
-    ("mako_order_id", "Mako-internal order identifier for PCAP correlation."),
-    ("pcap_id", "PCAP correlation identifier linking to raw network captures."),
-    ("batch_id", "Batch identifier grouping related events together."),
-    ("dealer_id", "Dealer identifier at the exchange."),
+    "source_ip": "Source IP address of the captured network packet.",
+    "source_port": "Source port of the captured network packet.",
+    "destination_ip": "Destination IP address of the captured network packet.",
+    "destination_port": "Destination port of the captured network packet.",
+    "message_type": "Message type classification for the captured packet.",
+    "normalised_message_type": "Normalised message type for cross-exchange comparison.",
+    "native_type": "Exchange-native message type code.",
+    "channel_id": "Channel identifier for the data feed or connection.",
+    "connection_kind": "Type of connection (TCP, UDP, multicast, etc.).",
+    "connection_feed": "Feed identifier for the market data connection.",
+    "host": "Hostname of the network endpoint.",
+    "port": "Port number of the network endpoint.",
+    "spark_event_type": "Spark algorithm event type classification.",
+    "native_event_type": "Exchange-native event type code.",
+    "broker_name": "Name of the broker for this event.",
+    "order_identifier": "Exchange or broker order identifier.",
+    "exchange_order_id": "Exchange-assigned order identifier.",
+    "mako_order_id": "Mako-internal order identifier for PCAP correlation.",
+    "pcap_id": "PCAP correlation identifier linking to raw network captures.",
+    "batch_id": "Batch identifier grouping related events together.",
+    "dealer_id": "Dealer identifier at the exchange.",
     # Market state fields
-    (
-        "market_state",
-        "Numeric code representing the current market state (pre-open, open, auction, halt, close, etc.).",
-    ),
-    (
-        "instrument_type",
-        "Type classification of the instrument for market state purposes.",
-    ),
-    (
-        "data_order_identifier",
-        "Data ordering identifier for sequencing market state updates.",
-    ),
-    (
-        "keyframe",
-        "Boolean indicating whether this event is a keyframe (full state snapshot vs. incremental).",
-    ),
-    ("open_timestamp", "Timestamp when the market opened for trading on this date."),
-    ("close_timestamp", "Timestamp when the market closed for trading on this date."),
+    "market_state": "Numeric code representing the current market state (pre-open, open, auction, halt, close, etc.).",
+    "instrument_type": "Type classification of the instrument for market state purposes.",
+    "data_order_identifier": "Data ordering identifier for sequencing market state updates.",
+    "keyframe": "Boolean indicating whether this event is a keyframe (full state snapshot vs. incremental).",
+    "open_timestamp": "Timestamp when the market opened for trading on this date.",
+    "close_timestamp": "Timestamp when the market closed for trading on this date.",
     # Vol surface fields
-    ("rec_date", "Recording date for the volatility surface snapshot."),
-    ("vol_region", "Volatility region or surface zone identifier."),
+    "rec_date": "Recording date for the volatility surface snapshot.",
+    "vol_region": "Volatility region or surface zone identifier.",
     # Latency stats fields
-    (
-        "is_breached",
-        "Boolean indicating whether market-making compliance was breached.",
-    ),
-    ("num_of_breaches", "Number of market-making compliance breaches so far today."),
-    ("max_breach_permitted", "Maximum number of breaches permitted before penalty."),
-    (
-        "requirement_check_timestamp",
-        "Timestamp of the last market-making requirement check.",
-    ),
+    "is_breached": "Boolean indicating whether market-making compliance was breached.",
+    "num_of_breaches": "Number of market-making compliance breaches so far today.",
+    "max_breach_permitted": "Maximum number of breaches permitted before penalty.",
+    "requirement_check_timestamp": "Timestamp of the last market-making requirement check.",
     # Stream metadata
-    ("stream_id", "Unique identifier for the data stream."),
-    ("event_type", "Type classification of the streaming event."),
+    "stream_id": "Unique identifier for the data stream.",
+    "event_type": "Type classification of the streaming event.",
     # Brazil-specific
-    (
-        "is_market_maker_instrument",
-        "Boolean indicating whether this instrument is designated for market-making.",
-    ),
-    ("level", "Price level index in the order book."),
-    ("market_price_level", "Market price at this order book level."),
-    ("volume_ahead_insert", "Volume ahead of our order at insertion time."),
-    ("volume_ahead_tob", "Volume ahead of our order relative to top-of-book."),
-    ("volume_behind_tob", "Volume behind our order relative to top-of-book."),
-    ("our_pos", "Our queue position at this price level in the order book."),
-    ("order_book_side", "Side of the order book (BID/ASK) for this position."),
-    (
-        "market_event_type",
-        "Type classification of the market event that triggered this update.",
-    ),
-    ("delta_bucket", "Delta bucket classification for this instrument."),
-    ("reason", "Reason code for this order or event action."),
-    ("reason_name", "Human-readable name for the reason code."),
-    ("client_id", "Client identifier at the exchange."),
-    ("session_group", "Session group identifier for exchange connectivity."),
-    ("session", "Session identifier for exchange connectivity."),
-    ("client_order_id", "Client-side order identifier sent to the exchange."),
-    ("exch_order_id", "Exchange-assigned order identifier."),
-    ("exch_fill_id", "Exchange-assigned fill identifier."),
-    ("trans_id", "Transaction identifier at the exchange."),
-    ("order_side", "Side of the order (BUY/SELL)."),
-    ("order_type", "Type of order (limit, market, etc.)."),
-    ("total_volume", "Total volume of the order."),
-    ("resid_volume", "Residual (remaining unfilled) volume of the order."),
-    ("result_code", "Result code from the exchange for this order transaction."),
-    ("result_info", "Additional result information from the exchange."),
-    ("result_tag", "Result tag or classification from the exchange."),
-    ("leg_head_type", "Leg head type for combo order fills."),
-    ("trade_time", "Exchange trade time for this fill."),
-    ("worst_price", "Worst acceptable price for this BOSH order."),
-    ("largest_size", "Largest fill size seen for this BOSH order."),
+    "is_market_maker_instrument": "Boolean indicating whether this instrument is designated for market-making.",
+    "level": "Price level index in the order book.",
+    "market_price_level": "Market price at this order book level.",
+    "volume_ahead_insert": "Volume ahead of our order at insertion time.",
+    "volume_ahead_tob": "Volume ahead of our order relative to top-of-book.",
+    "volume_behind_tob": "Volume behind our order relative to top-of-book.",
+    "our_pos": "Our queue position at this price level in the order book.",
+    "order_book_side": "Side of the order book (BID/ASK) for this position.",
+    "market_event_type": "Type classification of the market event that triggered this update.",
+    "delta_bucket": "Delta bucket classification for this instrument.",
+    "reason": "Reason code for this order or event action.",
+    "reason_name": "Human-readable name for the reason code.",
+    "client_id": "Client identifier at the exchange.",
+    "session_group": "Session group identifier for exchange connectivity.",
+    "session": "Session identifier for exchange connectivity.",
+    "client_order_id": "Client-side order identifier sent to the exchange.",
+    "exch_order_id": "Exchange-assigned order identifier.",
+    "exch_fill_id": "Exchange-assigned fill identifier.",
+    "trans_id": "Transaction identifier at the exchange.",
+    "order_side": "Side of the order (BUY/SELL).",
+    "order_type": "Type of order (limit, market, etc.).",
+    "total_volume": "Total volume of the order.",
+    "resid_volume": "Residual (remaining unfilled) volume of the order.",
+    "result_code": "Result code from the exchange for this order transaction.",
+    "result_info": "Additional result information from the exchange.",
+    "result_tag": "Result tag or classification from the exchange.",
+    "leg_head_type": "Leg head type for combo order fills.",
+    "trade_time": "Exchange trade time for this fill.",
+    "worst_price": "Worst acceptable price for this BOSH order.",
+    "largest_size": "Largest fill size seen for this BOSH order.",
     # NSE-specific
-    (
-        "option_underlying",
-        "Underlying instrument value for option base value calculation.",
-    ),
-    ("option_roll", "Roll value for the option underlying."),
-    (
-        "option_underlying_is_valid",
-        "Boolean indicating whether the option underlying value is valid.",
-    ),
-    ("option_term", "Option term/maturity for base value calculation."),
-    ("base_term", "Base term for value calculation."),
-    ("option_underlying_type", "Type of the option underlying instrument."),
-    (
-        "update_instrument_hash",
-        "Instrument hash of the market data update that triggered this value.",
-    ),
-    ("update_sequence_number", "Sequence number of the triggering market data update."),
-    (
-        "nnf_message_type",
-        "NNF (Nuvama Native Format) message type for NSE order tracking.",
-    ),
-    ("trader_id", "Trader identifier at the exchange."),
+    "option_underlying": "Underlying instrument value for option base value calculation.",
+    "option_roll": "Roll value for the option underlying.",
+    "option_underlying_is_valid": "Boolean indicating whether the option underlying value is valid.",
+    "option_term": "Option term/maturity for base value calculation.",
+    "base_term": "Base term for value calculation.",
+    "option_underlying_type": "Type of the option underlying instrument.",
+    "update_instrument_hash": "Instrument hash of the market data update that triggered this value.",
+    "update_sequence_number": "Sequence number of the triggering market data update.",
+    "nnf_message_type": "NNF (Nuvama Native Format) message type for NSE order tracking.",
     # Single-word columns that the catch-all won't cover (no underscore)
-    (
-        "forward",
-        "Forward price of the underlying instrument used in theoretical calculations.",
-    ),
-    ("timestamp", "Timestamp of this event or record."),
-    ("label", "Label or tag identifying the type of this record."),
-    ("component", "System component name that generated this event."),
-    ("uuid", "Universally unique identifier for this record."),
-    ("user", "User identifier associated with this trade or action."),
-    ("company", "Company or firm identifier for this trade."),
-    ("note", "Free-text note or annotation attached to this record."),
-    ("trader", "Trader name or identifier responsible for this action."),
-    ("payload", "Raw message payload for debugging or replay purposes."),
-    ("quantity", "Quantity of the trade or order in number of lots."),
-    ("summary", "Nested summary record containing aggregated event statistics."),
-    (
-        "metadata",
-        "Nested metadata record containing stream identification and entity scope.",
-    ),
-    (
-        "sequence_number",
-        "Monotonically increasing sequence number for ordering events.",
-    ),
-    (
-        "is_snap",
-        "Boolean indicating whether this event is a snapshot (full state) or incremental update.",
-    ),
-    ("data_timestamp", "Timestamp from the data feed for this event."),
-    ("lvol", "Log-transformed volatility value used in internal pricing calculations."),
-    ("norms", "Normalized parameter values for the pricing model."),
-    ("mode", "Operating mode of the algorithm or pricing model."),
-    ("volume", "Volume (number of lots) for this fill or order event."),
+    "forward": "Forward price of the underlying instrument used in theoretical calculations.",
+    "timestamp": "Timestamp of this event or record.",
+    "label": "Label or tag identifying the type of this record.",
+    "component": "System component name that generated this event.",
+    "uuid": "Universally unique identifier for this record.",
+    "user": "User identifier associated with this trade or action.",
+    "company": "Company or firm identifier for this trade.",
+    "note": "Free-text note or annotation attached to this record.",
+    "trader": "Trader name or identifier responsible for this action.",
+    "payload": "Raw message payload for debugging or replay purposes.",
+    "quantity": "Quantity of the trade or order in number of lots.",
+    "summary": "Nested summary record containing aggregated event statistics.",
+    "metadata": "Nested metadata record containing stream identification and entity scope.",
+    "sequence_number": "Monotonically increasing sequence number for ordering events.",
+    "is_snap": "Boolean indicating whether this event is a snapshot (full state) or incremental update.",
+    "data_timestamp": "Timestamp from the data feed for this event.",
+    "lvol": "Log-transformed volatility value used in internal pricing calculations.",
+    "norms": "Normalized parameter values for the pricing model.",
+    "mode": "Operating mode of the algorithm or pricing model.",
+    "volume": "Volume (number of lots) for this fill or order event.",
     # VtCommon shared fields with better descriptions
+    "is_spark": "Boolean flag indicating whether the VT is using a sparkOrder interface.",
+    "is_bv_invalid": "Boolean flag indicating whether the base valuation was invalid at the time of this event.",
+    "is_ref_theo_invalid": "Boolean flag indicating whether the reference theoretical values were invalid at the time of this event.",
+    "lb_enabled": "Boolean flag indicating whether the layered base feature was enabled.",
+    "edge_model_type": "Numeric code for the edge computation model type used by the VT.",
+    "bv_side": "Side (BUY/SELL) of the base valuation the VT is referencing for pricing.",
+    "tv": "Theoretical value the VT computed for this instrument at the time of the event.",
+    "fees": "Per-lot trading fees applicable to this instrument.",
+    "roll": "Roll value at the time of the event, representing cost of carry adjustments.",
+}
+
+# BigQuery type groups checked by the suffix/prefix heuristics
+_INTEGER_TYPES = frozenset({"INTEGER", "INT64"})
+_BOOLEAN_TYPES = frozenset({"BOOLEAN", "BOOL"})
+
+# Columns with an exact-match description that the generic suffix rules skip
+_EXCHANGE_SUFFIX_EXCLUDED = frozenset({"routed_exchange", "executable_exchange"})
+_TYPE_SUFFIX_EXCLUDED = frozenset(
+    {
+        "position_type",
+        "inst_type",
+        "exercise_type",
+        "payment_type",
+        "order_type",
+        "delete_type",
+        "trigger_type",
+        "update_type",
+    }
+)
+_DATE_SUFFIX_EXCLUDED = frozenset(
+    {
+        "trade_date",
+        "rec_date",
+        "event_date",
+        "exchange_date",
+        "agg_pos_date",
+        "issue_date",
+        "settlement_date",
+        "value_date",
+    }
+)
+
+# Anchored name patterns used by generate_tier3_description, in the order the
+# function checks them. They are compiled into a single alternation so each
+# column costs one regex match; ``lastgroup`` names the branch that fired.
+# Compiling it takes well under a millisecond and an unpickled Pattern is just
+# recompiled, so it is built at import rather than cached on disk.
+_TIER3_PATTERNS: list[tuple[str, str]] = [
+    ("strike", r"strike_(?P<strike_dir>minus|plus|atm)_(?P<strike_off>\d+)"),
+    ("ivol", r"ivol_(?P<ivol_dir>minus|plus|atm)_(?P<ivol_off>\d+)"),
+    ("svol", r"svol_(?P<svol_dir>minus|plus|atm)_(?P<svol_off>\d+)"),
+    ("latency", r"latency_stats?_(?P<latency_component>\w+)"),
     (
-        "is_spark",
-        "Boolean flag indicating whether the VT is using a sparkOrder interface.",
-    ),
-    (
-        "is_bv_invalid",
-        "Boolean flag indicating whether the base valuation was invalid at the time of this event.",
+        "gateway",
+        r"(?P<gw_component>gateway|matching_engine|rms|adapter|internal_server)"
+        r"_(?P<gw_direction>received|ingress|egress|rx|tx)_timestamp(?P<gw_ns>_ns)?",
     ),
     (
-        "is_ref_theo_invalid",
-        "Boolean flag indicating whether the reference theoretical values were invalid at the time of this event.",
+        "ingress_egress",
+        r"(?P<ie_direction>ingress|egress)_(?P<ie_layer>software|hardware)"
+        r"_timestamp(?P<ie_ns>_ns)?",
     ),
+    ("custom_greek", r"custom_greek_(?P<greek_num>\d+)"),
+    ("orders", r"(?P<orders_side>bid|ask)_orders_(?P<orders_level>\d+)"),
     (
-        "lb_enabled",
-        "Boolean flag indicating whether the layered base feature was enabled.",
+        "book",
+        r"(?P<book_side>bid|ask)_(?P<book_metric>price|volume)_(?P<book_level>\d+)",
     ),
     (
-        "edge_model_type",
-        "Numeric code for the edge computation model type used by the VT.",
+        "depth",
+        r"depth_(?P<depth_side>bid|ask)_(?P<depth_metric>price|volume)"
+        r"_(?P<depth_level>\d+)",
     ),
     (
-        "bv_side",
-        "Side (BUY/SELL) of the base valuation the VT is referencing for pricing.",
+        "implied",
+        r"implied_(?P<implied_side>bid|ask)_(?P<implied_metric>price|volume)"
+        r"_(?P<implied_level>\d+)",
     ),
     (
-        "tv",
-        "Theoretical value the VT computed for this instrument at the time of the event.",
+        "slippage",
+        r"(?P<slip_component>delta|vol|roll|residual|total|underlying)"
+        r"_slippage_(?P<slip_interval>\w+)",
     ),
-    ("fees", "Per-lot trading fees applicable to this instrument."),
     (
-        "roll",
-        "Roll value at the time of the event, representing cost of carry adjustments.",
+        "quote_update",
+        r"(?P<new_prefix>new|raw|delete_trigger)_(?P<new_metric>price|size)"
+        r"_(?P<new_side>bid|ask)",
     ),
 ]
+_TIER3_RE = re.compile("|".join(f"(?P<{tag}>{pat})" for tag, pat in _TIER3_PATTERNS))
+
+# Type hint appended by the snake_case catch-all
+_TYPE_HINT: dict[str, str] = {
+    "STRING": "text",
+    "INTEGER": "numeric",
+    "INT64": "numeric",
+    "FLOAT64": "numeric value",
+    "BOOLEAN": "flag",
+    "BOOL": "flag",
+    "TIMESTAMP": "timestamp",
+    "DATE": "date",
+}
+
+
+# Unconditional prefix rules, keyed on the first "_"-separated token; {rest}
+# is the remainder of the name in words. They are consecutive in the rule
+# order, so one lookup replaces the chain of checks.
+_PREFIX_TEMPLATES: dict[str, str] = {
+    "kafka": "Kafka infrastructure field: {rest}. Used for data pipeline tracking.",
+    "streamsource": (
+        "Stream source {rest} identifier from the data streaming infrastructure."
+    ),
+    "datasource": "Data source {rest} identifier from the data pipeline infrastructure.",
+    "parent": "Parent instrument {rest} from the instrument definition.",
+    "child": "Child leg {rest} from the combo instrument definition.",
+    "leg": "Combo leg {rest}.",
+    "ref": "Reference {rest} from the last vol curve update (theoServer callback).",
+}
+
+_CAMEL_RE = re.compile(r"([A-Z])")
 
 
 def _camel_to_words(name: str) -> str:
     """Convert camelCase to space-separated words."""
-    s = re.sub(r"([A-Z])", r" \1", name)
+    s = _CAMEL_RE.sub(r" \1", name)
     return s.strip().lower()
 
 
@@ -807,28 +751,43 @@ def _snake_to_words(name: str) -> str:
     return name.replace("_", " ").strip()
 
 
+@functools.cache
 def generate_tier3_description(col_name: str, col_type: str) -> str | None:
-    """Generate a description from naming patterns when Tier 1 and 2 fail."""
+    """Generate a description from naming patterns when Tier 1 and 2 fail.
+
+    Cached: the rules depend only on the name and type, and the same columns
+    recur in every market. The key space is bounded by the catalog's distinct
+    (name, type) pairs, so the cache is unbounded and skips LRU bookkeeping.
+    """
     # Exact match patterns
-    for pattern_name, desc in _PATTERN_DESCRIPTIONS:
-        if col_name == pattern_name:
-            return desc
+    desc = _PATTERN_DESCRIPTIONS.get(col_name)
+    if desc is not None:
+        return desc
+
+    # Split off the first and last "_"-separated tokens once; the prefix and
+    # suffix checks below compare against these instead of rescanning col_name,
+    # and use the remainders (after_prefix / stem) instead of slicing it
+    prefix, has_sep, after_prefix = col_name.partition("_")
+    stem, _, suffix = col_name.rpartition("_")
+    if not has_sep:
+        prefix = suffix = ""
+
+    pattern_match = _TIER3_RE.fullmatch(col_name)
+    pattern = pattern_match.lastgroup if pattern_match else None
 
     # Vol surface strike bucket patterns: strike_minus_N, strike_plus_N, strike_atm_N
-    strike_match = re.match(r"^strike_(minus|plus|atm)_(\d+)$", col_name)
-    if strike_match:
-        direction = strike_match.group(1)
-        offset = strike_match.group(2)
+    if pattern == "strike":
+        direction = pattern_match["strike_dir"]
+        offset = pattern_match["strike_off"]
         if direction == "atm":
             return f"Strike level at ATM offset {offset} on the normalized volatility surface."
         sign = "-" if direction == "minus" else "+"
         return f"Strike level at {sign}{offset} normalized offset from ATM on the volatility surface."
 
     # Implied vol surface: ivol_minus_N, ivol_plus_N, ivol_atm_N
-    ivol_match = re.match(r"^ivol_(minus|plus|atm)_(\d+)$", col_name)
-    if ivol_match:
-        direction = ivol_match.group(1)
-        offset = ivol_match.group(2)
+    if pattern == "ivol":
+        direction = pattern_match["ivol_dir"]
+        offset = pattern_match["ivol_off"]
         if direction == "atm":
             return f"Implied volatility at ATM offset {offset} on the normalized strike surface."
         sign = "-" if direction == "minus" else "+"
@@ -837,10 +796,9 @@ def generate_tier3_description(col_name: str, col_type: str) -> str | None:
         )
 
     # Smoothed vol surface: svol_minus_N, svol_plus_N, svol_atm_N
-    svol_match = re.match(r"^svol_(minus|plus|atm)_(\d+)$", col_name)
-    if svol_match:
-        direction = svol_match.group(1)
-        offset = svol_match.group(2)
+    if pattern == "svol":
+        direction = pattern_match["svol_dir"]
+        offset = pattern_match["svol_off"]
         if direction == "atm":
             return f"Smoothed volatility at ATM offset {offset} on the normalized strike surface."
         sign = "-" if direction == "minus" else "+"
@@ -852,55 +810,46 @@ def generate_tier3_description(col_name: str, col_type: str) -> str | None:
     if col_name.startswith("underlying_") and not col_name.startswith(
         "underlying_exe_exch"
     ):
-        rest = col_name[11:].replace("_", " ")
+        rest = col_name.removeprefix("underlying_").replace("_", " ")
         return f"Underlying instrument {rest}, mirrored from the parent instrument definition."
 
     # Latency stat fields: latency_stats_*
-    latency_match = re.match(r"^latency_stats?_(\w+)$", col_name)
-    if latency_match:
-        component = latency_match.group(1).replace("_", " ")
+    if pattern == "latency":
+        component = pattern_match["latency_component"].replace("_", " ")
         return f"Latency statistics for the {component} processing stage (nanoseconds)."
 
     # Gateway/matching engine timestamps
-    gw_match = re.match(
-        r"^(gateway|matching_engine|rms|adapter|internal_server)_(received|ingress|egress|rx|tx)_timestamp(_ns)?$",
-        col_name,
-    )
-    if gw_match:
-        component = gw_match.group(1).replace("_", " ")
-        direction = gw_match.group(2)
-        ns = " (nanosecond component)" if gw_match.group(3) else ""
+    if pattern == "gateway":
+        component = pattern_match["gw_component"].replace("_", " ")
+        direction = pattern_match["gw_direction"]
+        ns = " (nanosecond component)" if pattern_match["gw_ns"] else ""
         return f"Timestamp when the message was {direction}d at the {component}{ns}."
 
     # Ingress/egress software/hardware timestamps
-    ie_match = re.match(
-        r"^(ingress|egress)_(software|hardware)_timestamp(_ns)?$", col_name
-    )
-    if ie_match:
-        direction = ie_match.group(1)
-        layer = ie_match.group(2)
-        ns = " (nanosecond component)" if ie_match.group(3) else ""
+    if pattern == "ingress_egress":
+        direction = pattern_match["ie_direction"]
+        layer = pattern_match["ie_layer"]
+        ns = " (nanosecond component)" if pattern_match["ie_ns"] else ""
         return f"Timestamp at {layer} {direction} point{ns}."
 
     # Custom greek fields
-    custom_greek_match = re.match(r"^custom_greek_(\d+)$", col_name)
-    if custom_greek_match:
-        num = custom_greek_match.group(1)
+    if pattern == "custom_greek":
+        num = pattern_match["greek_num"]
         return f"Custom Greek value #{num}, a user-defined sensitivity metric."
 
     # theo_* fields (from TheoData)
-    if col_name.startswith("theo_") and col_name not in ("theo_compute_type",):
-        rest = col_name[5:].replace("_", " ")
+    if prefix == "theo" and col_name != "theo_compute_type":
+        rest = after_prefix.replace("_", " ")
         return f"Theoretical pricing parameter: {rest}."
 
     # param_* fields (vol surface parameters)
-    if col_name.startswith("param_"):
-        rest = col_name[6:].replace("_", " ")
+    if prefix == "param":
+        rest = after_prefix.replace("_", " ")
         return f"Volatility surface parameter: {rest}."
 
     # greek_* fields (vol surface greeks)
-    if col_name.startswith("greek_"):
-        rest = col_name[6:].replace("_", " ")
+    if prefix == "greek":
+        rest = after_prefix.replace("_", " ")
         return f"Volatility surface Greek parameter: {rest}."
 
     # snap_ts / rec_ts for snapshot tables
@@ -910,127 +859,85 @@ def generate_tier3_description(col_name: str, col_type: str) -> str | None:
         return "Timestamp when this record was received or recorded."
 
     # bid_orders_N / ask_orders_N
-    orders_match = re.match(r"^(bid|ask)_orders_(\d+)$", col_name)
-    if orders_match:
-        side = orders_match.group(1)
-        level = orders_match.group(2)
+    if pattern == "orders":
+        side = pattern_match["orders_side"]
+        level = pattern_match["orders_level"]
         return f"Number of {side}-side orders at level {level} of the order book."
 
     # *_exchange fields
-    if col_name.endswith("_exchange") and col_name not in (
-        "routed_exchange",
-        "executable_exchange",
-    ):
-        base = col_name[:-9].replace("_", " ")
+    if suffix == "exchange" and col_name not in _EXCHANGE_SUFFIX_EXCLUDED:
+        base = stem.replace("_", " ")
         return f"Exchange identifier for the {base}."
 
     # Suffix/prefix patterns
-    if col_name.endswith("_timestamp_ns"):
-        base = col_name[:-13].replace("_", " ")
-        return f"Nanosecond-precision component of the {base} timestamp. Combine with {col_name[:-3]} for full nanosecond-resolution timing."
+    if suffix == "ns" and col_name.endswith("_timestamp_ns"):
+        base = col_name.removesuffix("_timestamp_ns").replace("_", " ")
+        return f"Nanosecond-precision component of the {base} timestamp. Combine with {stem} for full nanosecond-resolution timing."
 
-    if col_name.endswith("_timestamp") and col_name != "partition_timestamp_local":
-        base = col_name[:-10].replace("_", " ")
+    if suffix == "timestamp" and col_name != "partition_timestamp_local":
+        base = stem.replace("_", " ")
         return f"Timestamp recording when the {base} occurred."
 
-    if col_name.endswith("_ns") and col_type in ("INTEGER", "INT64"):
-        base_col = col_name[:-3]
-        base = base_col.replace("_", " ")
-        return f"Nanosecond-precision component of {base}. Combine with {base_col} for full nanosecond-resolution timing."
+    if suffix == "ns" and col_type in _INTEGER_TYPES:
+        base = stem.replace("_", " ")
+        return f"Nanosecond-precision component of {base}. Combine with {stem} for full nanosecond-resolution timing."
 
-    if col_name.endswith("_hash"):
-        base = col_name[:-5].replace("_", " ")
+    if suffix == "hash":
+        base = stem.replace("_", " ")
         return f"SHA256 hash identifier for the {base}."
 
-    if col_name.startswith("is_") and col_type in ("BOOLEAN", "BOOL"):
-        what = col_name[3:].replace("_", " ")
+    if prefix == "is" and col_type in _BOOLEAN_TYPES:
+        what = after_prefix.replace("_", " ")
         return f"Boolean flag indicating whether the {what} condition is true."
 
-    if col_name.startswith("is_") and col_type in ("INTEGER", "INT64"):
-        what = col_name[3:].replace("_", " ")
+    if prefix == "is" and col_type in _INTEGER_TYPES:
+        what = after_prefix.replace("_", " ")
         return f"Flag indicating whether the {what} condition is true. Stored as integer (0=false, 1=true)."
 
     # Order book levels: bid_price_N, ask_price_N, bid_volume_N, ask_volume_N
-    book_match = re.match(r"^(bid|ask)_(price|volume)_(\d+)$", col_name)
-    if book_match:
-        side = book_match.group(1)
-        metric = book_match.group(2)
-        level = int(book_match.group(3))
+    if pattern == "book":
+        side = pattern_match["book_side"]
+        metric = pattern_match["book_metric"]
+        level = int(pattern_match["book_level"])
         return f"Unadjusted {side}-side {metric} at level {level} of the order book."
 
     # Depth levels: e.g. depth_bid_price_1, depth_ask_volume_3
-    depth_match = re.match(r"^depth_(bid|ask)_(price|volume)_(\d+)$", col_name)
-    if depth_match:
-        side = depth_match.group(1)
-        metric = depth_match.group(2)
-        level = int(depth_match.group(3))
+    if pattern == "depth":
+        side = pattern_match["depth_side"]
+        metric = pattern_match["depth_metric"]
+        level = int(pattern_match["depth_level"])
         return f"Market depth {side}-side {metric} at level {level}."
 
     # Implied levels
-    implied_match = re.match(r"^implied_(bid|ask)_(price|volume)_(\d+)$", col_name)
-    if implied_match:
-        side = implied_match.group(1)
-        metric = implied_match.group(2)
-        level = int(implied_match.group(3))
+    if pattern == "implied":
+        side = pattern_match["implied_side"]
+        metric = pattern_match["implied_metric"]
+        level = int(pattern_match["implied_level"])
         return f"Implied order book {side}-side {metric} at level {level}."
 
     # *_bid / *_ask suffixes
-    if col_name.endswith("_bid"):
-        base = col_name[:-4].replace("_", " ")
+    if suffix == "bid":
+        base = stem.replace("_", " ")
         return f"Bid-side value of {base}."
 
-    if col_name.endswith("_ask"):
-        base = col_name[:-4].replace("_", " ")
+    if suffix == "ask":
+        base = stem.replace("_", " ")
         return f"Ask-side value of {base}."
 
     # *_name enum columns
-    name_match = re.match(r"^(.+)_name$", col_name)
-    if name_match and col_type == "STRING":
-        base = name_match.group(1).replace("_", " ")
+    if stem and suffix == "name" and col_type == "STRING":
+        base = stem.replace("_", " ")
         return f"Human-readable name for the {base} enum value."
 
-    # Kafka infrastructure
-    if col_name.startswith("kafka_"):
-        rest = col_name[6:].replace("_", " ")
-        return f"Kafka infrastructure field: {rest}. Used for data pipeline tracking."
-
-    # streamsource_* and datasource_* fields
-    if col_name.startswith("streamsource_"):
-        rest = col_name[13:].replace("_", " ")
-        return (
-            f"Stream source {rest} identifier from the data streaming infrastructure."
-        )
-
-    if col_name.startswith("datasource_"):
-        rest = col_name[11:].replace("_", " ")
-        return f"Data source {rest} identifier from the data pipeline infrastructure."
-
-    # parent_* fields (instrument reference)
-    if col_name.startswith("parent_"):
-        rest = col_name[7:].replace("_", " ")
-        return f"Parent instrument {rest} from the instrument definition."
-
-    # child_* / leg_* fields
-    if col_name.startswith("child_"):
-        rest = col_name[6:].replace("_", " ")
-        return f"Child leg {rest} from the combo instrument definition."
-
-    if col_name.startswith("leg_"):
-        rest = col_name[4:].replace("_", " ")
-        return f"Combo leg {rest}."
-
-    # ref_* fields (reference values from VtCommon)
-    if col_name.startswith("ref_"):
-        rest = col_name[4:].replace("_", " ")
-        return f"Reference {rest} from the last vol curve update (theoServer callback)."
+    # Infrastructure and instrument-reference prefixes (kafka_*, parent_*, ...)
+    template = _PREFIX_TEMPLATES.get(prefix)
+    if template is not None:
+        return template.format(rest=after_prefix.replace("_", " "))
 
     # slippage columns (KPI layer)
-    slip_match = re.match(
-        r"^(delta|vol|roll|residual|total|underlying)_slippage_(\w+)$", col_name
-    )
-    if slip_match:
-        component = slip_match.group(1)
-        interval = slip_match.group(2).replace("_", " ")
+    if pattern == "slippage":
+        component = pattern_match["slip_component"]
+        interval = pattern_match["slip_interval"].replace("_", " ")
         return f"{component.capitalize()} component of slippage at the {interval} interval."
 
     # edge columns
@@ -1044,13 +951,12 @@ def generate_tier3_description(col_name: str, col_type: str) -> str | None:
         return f"PnL metric: {words}."
 
     # new_price_* / new_size_* / raw_price_* / delete_trigger_price_*
-    new_match = re.match(r"^(new|raw|delete_trigger)_(price|size)_(bid|ask)$", col_name)
-    if new_match:
-        prefix = new_match.group(1).replace("_", " ")
-        metric = new_match.group(2)
-        side = new_match.group(3)
+    if pattern == "quote_update":
+        update_kind = pattern_match["new_prefix"].replace("_", " ")
+        metric = pattern_match["new_metric"]
+        side = pattern_match["new_side"]
         return (
-            f"{prefix.capitalize()} {metric} for the {side} side of the quote update."
+            f"{update_kind.capitalize()} {metric} for the {side} side of the quote update."
         )
 
     # change_bid / change_ask
@@ -1067,85 +973,58 @@ def generate_tier3_description(col_name: str, col_type: str) -> str | None:
         return "Flag indicating whether this trade leg is from Mako or from the market."
 
     # *_id fields (generic)
-    if col_name.endswith("_id") and col_type == "STRING":
-        base = col_name[:-3].replace("_", " ")
+    if suffix == "id" and col_type == "STRING":
+        base = stem.replace("_", " ")
         return f"Identifier for the {base}."
 
     # *_type fields (generic)
-    if col_name.endswith("_type") and col_name not in (
-        "position_type",
-        "inst_type",
-        "exercise_type",
-        "payment_type",
-        "order_type",
-        "delete_type",
-        "trigger_type",
-        "update_type",
-    ):
-        base = col_name[:-5].replace("_", " ")
+    if suffix == "type" and col_name not in _TYPE_SUFFIX_EXCLUDED:
+        base = stem.replace("_", " ")
         return f"Type classification for the {base}."
 
     # *_count fields
-    if col_name.endswith("_count"):
-        base = col_name[:-6].replace("_", " ")
+    if suffix == "count":
+        base = stem.replace("_", " ")
         return f"Count of {base}."
 
     # *_rate fields
-    if col_name.endswith("_rate"):
-        base = col_name[:-5].replace("_", " ")
+    if suffix == "rate":
+        base = stem.replace("_", " ")
         return f"Rate value for {base}."
 
     # *_date fields
-    if col_name.endswith("_date") and col_name not in (
-        "trade_date",
-        "rec_date",
-        "event_date",
-        "exchange_date",
-        "agg_pos_date",
-        "issue_date",
-        "settlement_date",
-        "value_date",
-    ):
-        base = col_name[:-5].replace("_", " ")
+    if suffix == "date" and col_name not in _DATE_SUFFIX_EXCLUDED:
+        base = stem.replace("_", " ")
         return f"Date of {base}."
 
     # *_value fields
-    if col_name.endswith("_value") and col_name not in ("cash_value",):
-        base = col_name[:-6].replace("_", " ")
+    if suffix == "value" and col_name != "cash_value":
+        base = stem.replace("_", " ")
         return f"Value of {base}."
 
     # *_size fields
-    if col_name.endswith("_size") and not re.match(r"^(bid|ask|depth)", col_name):
-        base = col_name[:-5].replace("_", " ")
+    if suffix == "size" and not col_name.startswith(("bid", "ask", "depth")):
+        base = stem.replace("_", " ")
         return f"Size (quantity) of {base}."
 
     # *_price fields
-    if col_name.endswith("_price") and not re.match(
-        r"^(bid|ask|depth|new|raw|delete_trigger)", col_name
+    if suffix == "price" and not col_name.startswith(
+        ("bid", "ask", "depth", "new", "raw", "delete_trigger")
     ):
-        base = col_name[:-6].replace("_", " ")
+        base = stem.replace("_", " ")
         return f"Price of {base}."
 
     # *_volume fields
-    if col_name.endswith("_volume") and not re.match(
-        r"^(bid|ask|depth|implied)", col_name
+    if suffix == "volume" and not col_name.startswith(
+        ("bid", "ask", "depth", "implied")
     ):
-        base = col_name[:-7].replace("_", " ")
+        base = stem.replace("_", " ")
         return f"Volume of {base}."
 
     # Catch-all: generate from snake_case name + type
-    if "_" in col_name:
+    if has_sep:
         words = _snake_to_words(col_name)
-        type_hint = {
-            "STRING": "text",
-            "INTEGER": "numeric",
-            "INT64": "numeric",
-            "FLOAT64": "numeric value",
-            "BOOLEAN": "flag",
-            "BOOL": "flag",
-            "TIMESTAMP": "timestamp",
-            "DATE": "date",
-        }.get(col_type, "field")
+        type_hint = _TYPE_HINT.get(col_type, "field")
         return f"{words.capitalize()} ({type_hint})."
 
     return None
@@ -1205,22 +1084,14 @@ def generate_source(
     proto_file = bq_info.get("file", "")
 
     if source_field.startswith("props."):
-        proto_field = source_field[6:]  # strip "props."
+        proto_field = source_field.removeprefix("props.")
         # Strip _name and _ns suffixes for source references
-        clean = proto_field
-        if clean.endswith("_name"):
-            clean = clean[:-5]
-        if clean.endswith("_ns"):
-            clean = clean[:-3]
+        clean = proto_field.removesuffix("_name").removesuffix("_ns")
         return f'"VtCommon.proto::{clean}"'
 
     # Direct proto field reference
     proto_field = t_info["proto_field"]
-    clean = proto_field
-    if clean.endswith("_name"):
-        clean = clean[:-5]
-    if clean.endswith("_ns"):
-        clean = clean[:-3]
+    clean = proto_field.removesuffix("_name").removesuffix("_ns")
 
     if message_name and proto_file:
         return f'"{proto_file}::{clean}"'
@@ -1237,24 +1108,35 @@ def generate_source(
 
 def generate_changes(
     table_name: str,
-    yaml_path: Path,
+    data: dict[str, Any],
     omx_ref: dict[str, dict[str, dict[str, Any]]],
     transform_map: dict[str, dict[str, dict[str, Any]]],
     proto_desc_map: dict[str, dict[str, Any]],
     proto_to_bq: dict[str, dict[str, Any]],
+    cache: dict[tuple[str, ...], str | None] | None = None,
 ) -> dict[str, dict[str, Any]]:
-    """Determine what changes to make for each column.
+    """Determine what changes to make for each column of a parsed table YAML.
+
+    The caller loads ``data`` (see _load_yaml) so the same parse can be shared
+    with validation and the writer.
+
+    ``cache`` holds the Tier 2 description and source lookups, which depend
+    only on the names and the metadata maps. The same (table, column) pairs
+    recur in every market, so pass one dict for all tables that share maps.
 
     Returns: {col_name: {field: value, ...}} for columns that need updates.
     Only includes fields that are currently empty/missing and can be filled.
     """
-    data = yaml.safe_load(yaml_path.read_text())
+    if cache is None:
+        cache = {}
     columns = data.get("table", {}).get("columns", [])
     changes: dict[str, dict[str, Any]] = {}
+    ref_cols = omx_ref.get(table_name, {})
 
     for col in columns:
         col_name = col["name"]
         col_type = col.get("type", "")
+        ref_col_meta = ref_cols.get(col_name) or {}
         col_changes: dict[str, Any] = {}
 
         # --- Description ---
@@ -1264,36 +1146,32 @@ def generate_changes(
             tier = 0
 
             # Tier 1: Copy from OMX/KPI reference
-            ref_cols = omx_ref.get(table_name, {})
-            if col_name in ref_cols and "description" in ref_cols[col_name]:
-                desc = ref_cols[col_name]["description"]
+            if "description" in ref_col_meta:
+                desc = ref_col_meta["description"]
                 tier = 1
 
             # Tier 2: Proto + transform
             if desc is None:
-                desc = _build_tier2_description(
-                    col_name,
-                    col_type,
-                    table_name,
-                    transform_map,
-                    proto_desc_map,
-                    proto_to_bq,
-                )
+                key = ("tier2", table_name, col_name, col_type)
+                if key not in cache:
+                    cache[key] = _build_tier2_description(
+                        col_name,
+                        col_type,
+                        table_name,
+                        transform_map,
+                        proto_desc_map,
+                        proto_to_bq,
+                    )
+                desc = cache[key]
                 if desc:
                     tier = 2
 
-            # Tier 3: Name patterns
-            if desc is None:
+            # Tier 3: Name patterns. Also consulted when Tier 2 produced a very
+            # short description (< 30 chars), in which case a longer, more
+            # informative Tier 3 result wins.
+            if desc is None or (tier == 2 and len(desc) < 30):
                 tier3_desc = generate_tier3_description(col_name, col_type)
-                if tier3_desc:
-                    desc = tier3_desc
-                    tier = 3
-
-            # If Tier 2 produced a very short description (< 30 chars), prefer
-            # Tier 3 if it has a longer, more informative result
-            if desc and tier == 2 and len(desc) < 30:
-                tier3_desc = generate_tier3_description(col_name, col_type)
-                if tier3_desc and len(tier3_desc) > len(desc):
+                if tier3_desc and (desc is None or len(tier3_desc) > len(desc)):
                     desc = tier3_desc
                     tier = 3
 
@@ -1305,35 +1183,33 @@ def generate_changes(
         existing_source = col.get("source")
         if not existing_source:
             # Tier 1: Copy from OMX reference
-            ref_cols = omx_ref.get(table_name, {})
-            if col_name in ref_cols and "source" in ref_cols[col_name]:
-                col_changes["source"] = ref_cols[col_name]["source"]
+            if "source" in ref_col_meta:
+                col_changes["source"] = ref_col_meta["source"]
             else:
-                src = generate_source(table_name, col_name, transform_map, proto_to_bq)
+                key = ("source", table_name, col_name)
+                if key not in cache:
+                    cache[key] = generate_source(
+                        table_name, col_name, transform_map, proto_to_bq
+                    )
+                src = cache[key]
                 if src:
                     col_changes["source"] = src
 
         # --- Synonyms ---
+        # Tier 1 only: copy from OMX reference
         existing_synonyms = col.get("synonyms")
-        if existing_synonyms is None:
-            # Tier 1: Copy from OMX reference
-            ref_cols = omx_ref.get(table_name, {})
-            if col_name in ref_cols and "synonyms" in ref_cols[col_name]:
-                col_changes["synonyms"] = ref_cols[col_name]["synonyms"]
+        if existing_synonyms is None and "synonyms" in ref_col_meta:
+            col_changes["synonyms"] = ref_col_meta["synonyms"]
 
         # --- Business rules ---
         existing_rules = col.get("business_rules")
-        if not existing_rules:
-            ref_cols = omx_ref.get(table_name, {})
-            if col_name in ref_cols and "business_rules" in ref_cols[col_name]:
-                col_changes["business_rules"] = ref_cols[col_name]["business_rules"]
+        if not existing_rules and "business_rules" in ref_col_meta:
+            col_changes["business_rules"] = ref_col_meta["business_rules"]
 
         # --- Related columns ---
         existing_related = col.get("related_columns")
-        if not existing_related:
-            ref_cols = omx_ref.get(table_name, {})
-            if col_name in ref_cols and "related_columns" in ref_cols[col_name]:
-                col_changes["related_columns"] = ref_cols[col_name]["related_columns"]
+        if not existing_related and "related_columns" in ref_col_meta:
+            col_changes["related_columns"] = ref_col_meta["related_columns"]
 
         if col_changes:
             changes[col_name] = col_changes
@@ -1345,14 +1221,96 @@ def generate_changes(
 # Surgical YAML Editing
 # ---------------------------------------------------------------------------
 
+# Line patterns used by apply_changes, compiled once for every file processed.
+# Field lines are classified by their key (see _split_key) instead of regex.
+_COL_RE = re.compile(r"^(\s+)-\s+name:\s+(\S+)\s*$")
+_NEXT_COL_RE = re.compile(r"^\s+-\s+name:\s+\S+")
+# Keys that end a multi-line description's continuation lines
+_FIELD_KEYS = frozenset(
+    {
+        "name",
+        "type",
+        "description",
+        "source",
+        "synonyms",
+        "category",
+        "filterable",
+        "example_values",
+        "typical_aggregation",
+        "business_rules",
+        "related_columns",
+        "comprehensive",
+        "formula",
+        "notes",
+        "preferred_timestamps",
+        "disambiguation",
+        "source_sql",
+        "proto_source",
+        "business_context",
+        "partition_field",
+        "cluster_fields",
+        "row_count_approx",
+        "dataset",
+        "fqn",
+        "layer",
+    }
+)
+# Fields inserted at the end of a column block when missing, in output order
+_INSERT_FIELDS = ("source", "synonyms", "business_rules", "related_columns")
+# Existing fields tracked per column so they are not inserted twice
+_TRACKED_FIELDS = frozenset(
+    {
+        "source",
+        "synonyms",
+        "business_rules",
+        "related_columns",
+        "category",
+        "filterable",
+        "example_values",
+        "typical_aggregation",
+        "comprehensive",
+        "formula",
+        "type",
+    }
+)
+# Values that count as an empty description
+_EMPTY_DESC_VALUES = frozenset({"", '""', "''"})
+
+
+def _split_key(line: str) -> tuple[int, str, str]:
+    """Split an indented ``key: value`` line into (indent, key, value).
+
+    ``key`` is "" for lines that are not indented or have no colon; for a
+    list item such as ``- name: x`` it keeps the dash (``"- name"``).
+    """
+    stripped = line.lstrip()
+    indent = len(line) - len(stripped)
+    key, has_colon, value = stripped.partition(":")
+    if not (indent and has_colon):
+        return indent, "", ""
+    return indent, key, value
+
+
+def _is_list_item_key(key: str) -> bool:
+    """True for the key of a ``- name:`` list item."""
+    return key[:1] == "-" and key[1:2].isspace() and key[1:].lstrip() == "name"
+
+
+# Leading characters that make a plain YAML scalar mean something else
+_YAML_INDICATOR_FIRST_CHARS = frozenset("{[&*!%|>")
+# Characters that force a source value to be quoted
+_SOURCE_QUOTE_CHARS = frozenset(":#{}[]")
+
 
 def _needs_yaml_quoting(s: str) -> bool:
     """Check if a YAML scalar value needs quoting."""
-    if ": " in s or s.endswith(":"):
+    # Most values contain neither ":" nor "#", so one scan each rules out
+    # the mapping/comment cases before the more specific checks
+    if ":" in s and (": " in s or s.endswith(":")):
         return True
-    if " #" in s or s.startswith("#"):
+    if "#" in s and (" #" in s or s.startswith("#")):
         return True
-    return s.startswith(("{", "[", "&", "*", "!", "%", "|", ">"))
+    return s[:1] in _YAML_INDICATOR_FIRST_CHARS
 
 
 def _format_description(desc: str, indent: str) -> list[str]:
@@ -1365,36 +1323,18 @@ def _format_description(desc: str, indent: str) -> list[str]:
         return lines
 
     if _needs_yaml_quoting(desc_str):
+        escaped = desc_str.replace("'", "''")
         if len(desc_str) > 80:
             # Use single-quoted multi-line format for long descriptions
-            # with YAML-sensitive characters
-            escaped = desc_str.replace("'", "''")
-            # Single-quoted scalar: wrap at 120 cols
-            words = escaped.split()
-            current_line = f"{indent}description: '{words[0]}"
-            continuation = indent + "  "
-            for word in words[1:]:
-                if len(current_line) + 1 + len(word) <= 118:  # account for trailing '
-                    current_line += " " + word
-                else:
-                    lines.append(current_line)
-                    current_line = continuation + word
-            lines.append(current_line + "'")
+            # with YAML-sensitive characters.
+            # Single-quoted scalar: wrap at 120 cols, leaving room for the closing '
+            lines = wrap_words(escaped, f"{indent}description: '", indent + "  ", 118)
+            lines[-1] += "'"
         else:
-            escaped = desc_str.replace("'", "''")
             lines.append(f"{indent}description: '{escaped}'")
     elif len(desc_str) > 80 or "\n" in desc_str:
         # Multi-line: word-wrap at ~120 columns
-        words = desc_str.split()
-        current_line = f"{indent}description: {words[0]}"
-        continuation = indent + "  "
-        for word in words[1:]:
-            if len(current_line) + 1 + len(word) <= 120:
-                current_line += " " + word
-            else:
-                lines.append(current_line)
-                current_line = continuation + word
-        lines.append(current_line)
+        lines = wrap_words(desc_str, f"{indent}description: ", indent + "  ")
     else:
         lines.append(f"{indent}description: {desc_str}")
 
@@ -1408,7 +1348,7 @@ def _format_source(src: str, indent: str) -> str:
     if src_str.startswith('"') and src_str.endswith('"'):
         return f"{indent}source: {src_str}"
     # Quote if contains special characters
-    if any(c in src_str for c in ":#{}[]"):
+    if not _SOURCE_QUOTE_CHARS.isdisjoint(src_str):
         escaped = src_str.replace("'", "''")
         return f"{indent}source: '{escaped}'"
     return f"{indent}source: {src_str}"
@@ -1430,16 +1370,8 @@ def _format_business_rules(rules: str, indent: str) -> list[str]:
     lines: list[str] = []
     if len(rules_str) > 80:
         lines.append(f"{indent}business_rules: >-")
-        words = rules_str.split()
         continuation = indent + "  "
-        current_line = continuation + words[0]
-        for word in words[1:]:
-            if len(current_line) + 1 + len(word) <= 120:
-                current_line += " " + word
-            else:
-                lines.append(current_line)
-                current_line = continuation + word
-        lines.append(current_line)
+        lines.extend(wrap_words(rules_str, continuation, continuation))
     elif _needs_yaml_quoting(rules_str):
         escaped = rules_str.replace("'", "''")
         lines.append(f"{indent}business_rules: '{escaped}'")
@@ -1458,27 +1390,61 @@ def _format_related_columns(cols: list[str], indent: str) -> list[str]:
     return lines
 
 
-def apply_changes(
-    yaml_path: Path,
-    changes: dict[str, dict[str, Any]],
-) -> None:
-    """Surgically edit a YAML file to insert/replace enrichment fields.
+# Formatter for each field in _INSERT_FIELDS: (value, indent) -> YAML lines
+_INSERT_FORMATTERS: dict[str, Callable[[Any, str], list[str]]] = {
+    "source": lambda src, indent: [_format_source(src, indent)],
+    "synonyms": _format_synonyms,
+    "business_rules": _format_business_rules,
+    "related_columns": _format_related_columns,
+}
+
+
+def _with_column_lookahead(lines: list[str]) -> Iterator[tuple[str, bool, bool]]:
+    """Yield (line, starts_column, next_starts_column) in a single forward pass.
+
+    Each line is checked for a column header once; the result is used as the
+    previous line's lookahead and then as its own header check. A substring
+    test rejects the common non-header lines before the regex runs.
+    """
+    it = iter(lines)
+    line = next(it, None)
+    if line is None:
+        return
+    starts_col = "name:" in line and _NEXT_COL_RE.match(line) is not None
+    for next_line in it:
+        next_starts_col = (
+            "name:" in next_line and _NEXT_COL_RE.match(next_line) is not None
+        )
+        yield line, starts_col, next_starts_col
+        line, starts_col = next_line, next_starts_col
+    yield line, starts_col, False
+
+
+def _render_changes(lines: list[str], changes: dict[str, dict[str, Any]]) -> bytes:
+    """Surgically edit YAML lines to insert/replace enrichment fields.
 
     Only replaces description: "" lines with generated descriptions.
     Inserts source/synonyms/business_rules/related_columns after existing fields
     when those fields are missing from the current column block.
+
+    Returns the edited file content as UTF-8 bytes.
     """
-    lines = yaml_path.read_text().splitlines()
-    result: list[str] = []
+    buf = io.StringIO()
     current_col: str | None = None
     col_indent = ""
     field_indent = ""
     in_columns = False
 
-    # Track which fields we've seen for the current column, so we can
-    # insert missing ones at the end of the column block
-    seen_fields: set[str] = set()
+    # Fields to insert at the end of the current column block; entries are
+    # dropped as the block turns out to already have them
     pending_inserts: dict[str, Any] = {}
+    # Changes for the current column, looked up once at its header line
+    col_changes: dict[str, Any] = {}
+
+    def _emit(*out_lines: str) -> None:
+        """Append lines to the output buffer, one write per line."""
+        for out_line in out_lines:
+            buf.write(out_line + "\n")
 
     def _flush_pending():
         """Insert any pending fields for the current column."""
@@ -1486,36 +1452,37 @@ def apply_changes(
         if not pending_inserts or not current_col:
             return
 
-        fi = field_indent
-
-        if "source" in pending_inserts:
-            result.append(_format_source(pending_inserts["source"], fi))
-        if "synonyms" in pending_inserts:
-            result.extend(_format_synonyms(pending_inserts["synonyms"], fi))
-        if "business_rules" in pending_inserts:
-            result.extend(_format_business_rules(pending_inserts["business_rules"], fi))
-        if "related_columns" in pending_inserts:
-            result.extend(
-                _format_related_columns(pending_inserts["related_columns"], fi)
-            )
+        # pending_inserts is built in _INSERT_FIELDS order, so iterating it
+        # emits the fields in output order without probing each one
+        for field, value in pending_inserts.items():
+            _emit(*_INSERT_FORMATTERS[field](value, field_indent))
 
         pending_inserts = {}
 
-    i = 0
-    n = len(lines)
+    # Indent of the description key while consuming its continuation lines
+    desc_indent: int | None = None
+
+    for line, starts_col, next_starts_col in _with_column_lookahead(lines):
+        indent, key, value = _split_key(line)
 
-    while i < n:
-        line = lines[i]
+        # Continuation lines of a multi-line description are more deeply
+        # indented than the field key and aren't a known field or list item.
+        if desc_indent is not None:
+            if desc_indent < indent < len(line) and not (
+                key in _FIELD_KEYS or _is_list_item_key(key)
+            ):
+                _emit(line)
+                continue
+            desc_indent = None
 
-        # Detect columns section
-        if re.match(r"^\s+columns:\s*$", line):
+        # Detect columns section (an indented bare "columns:" key)
+        if key == "columns" and not value.strip():
             in_columns = True
-            result.append(line)
-            i += 1
+            _emit(line)
             continue
 
-        # Detect a new column block
-        col_match = re.match(r"^(\s+)-\s+name:\s+(\S+)\s*$", line)
+        # Detect a new column block (_COL_RE only matches lines _NEXT_COL_RE does)
+        col_match = _COL_RE.match(line) if starts_col else None
         if col_match and in_columns:
             # Flush any pending inserts for the previous column
             _flush_pending()
@@ -1523,121 +1490,72 @@ def apply_changes(
             col_indent = col_match.group(1)
             field_indent = col_indent + "  "
             current_col = col_match.group(2).strip()
-            seen_fields = {"name"}
 
             # Prepare pending inserts for this column
             col_changes = changes.get(current_col, {})
-            pending_inserts = {}
-            for field in ["source", "synonyms", "business_rules", "related_columns"]:
-                if field in col_changes:
-                    pending_inserts[field] = col_changes[field]
+            pending_inserts = (
+                {f: col_changes[f] for f in _INSERT_FIELDS if f in col_changes}
+                if col_changes
+                else {}
+            )
 
-            result.append(line)
-            i += 1
+            _emit(line)
             continue
 
         # Inside a column block: detect field lines
         if in_columns and current_col:
-            # Check for description line
-            desc_match = re.match(r'^(\s+)description:\s*(""|\'\'|)\s*$', line)
-            if desc_match:
-                seen_fields.add("description")
-                col_changes = changes.get(current_col, {})
-                if "description" in col_changes:
-                    fi = desc_match.group(1)
-                    desc_lines = _format_description(col_changes["description"], fi)
-                    result.extend(desc_lines)
-                    i += 1
+            if key == "description":
+                desc_value = value.strip()
+                if desc_value in _EMPTY_DESC_VALUES:
+                    if "description" in col_changes:
+                        fi = line[:indent]
+                        desc_lines = _format_description(col_changes["description"], fi)
+                        _emit(*desc_lines)
+                    else:
+                        _emit(line)
                     continue
-                else:
-                    result.append(line)
-                    i += 1
+                if value[:1].isspace():
+                    # Existing non-empty description (possibly multi-line)
+                    _emit(line)
+                    desc_indent = indent
                     continue
 
-            # Check for existing non-empty description (multi-line)
-            desc_content_match = re.match(r"^(\s+)description:\s+\S", line)
-            if desc_content_match:
-                seen_fields.add("description")
-                result.append(line)
-                i += 1
-                # Consume continuation lines of multi-line description
-                while i < n:
-                    next_line = lines[i]
-                    # A continuation line is more deeply indented than the field key
-                    # and doesn't match a known field pattern
-                    if next_line and re.match(r"^\s+\S", next_line):
-                        # Check if this is a continuation or a new field
-                        is_field = re.match(
-                            r"^\s+(name|type|description|source|synonyms|category|"
-                            r"filterable|example_values|typical_aggregation|"
-                            r"business_rules|related_columns|comprehensive|formula|"
-                            r"notes|preferred_timestamps|disambiguation|"
-                            r"source_sql|proto_source|business_context|"
-                            r"partition_field|cluster_fields|row_count_approx|"
-                            r"dataset|fqn|layer):",
-                            next_line,
-                        )
-                        is_list_item = re.match(r"^\s+-\s+name:", next_line)
-                        if is_field or is_list_item:
-                            break
-                        # Check indent level: continuation lines are indented
-                        # deeper than the field line
-                        field_key_indent = len(desc_content_match.group(1))
-                        next_indent = len(next_line) - len(next_line.lstrip())
-                        if next_indent > field_key_indent:
-                            result.append(next_line)
-                            i += 1
-                        else:
-                            break
-                    else:
-                        break
-                continue
-
-            # Track other existing fields to avoid duplicating
-            for field_name in [
-                "source",
-                "synonyms",
-                "business_rules",
-                "related_columns",
-                "category",
-                "filterable",
-                "example_values",
-                "typical_aggregation",
-                "comprehensive",
-                "formula",
-                "type",
-            ]:
-                if re.match(rf"^\s+{field_name}:", line):
-                    seen_fields.add(field_name)
-                    # Remove from pending since it already exists
-                    pending_inserts.pop(field_name, None)
-                    break
-
-            # Detect end of column block: next column or end of columns
-            # We need to flush pending before the next column starts
-            if i + 1 < n:
-                next_line = lines[i + 1]
-                next_col = re.match(r"^\s+-\s+name:\s+\S+", next_line)
-                if next_col:
-                    result.append(line)
-                    _flush_pending()
-                    i += 1
-                    continue
+            # Remove existing fields from pending to avoid duplicating them
+            if pending_inserts and key in _TRACKED_FIELDS:
+                pending_inserts.pop(key, None)
 
-        # Handle end of file for last column
-        if i == n - 1 and in_columns and current_col:
-            result.append(line)
-            _flush_pending()
-            i += 1
-            continue
+            # Detect end of column block: flush pending before the next
+            # column starts (the last column is flushed after the loop)
+            if next_starts_col:
+                _emit(line)
+                _flush_pending()
+                continue
 
-        result.append(line)
-        i += 1
+        _emit(line)
 
     # Final flush for last column
     _flush_pending()
 
-    yaml_path.write_text("\n".join(result) + "\n")
+    return buf.getvalue().encode()
+
+
+def apply_changes(
+    yaml_path: Path,
+    changes: dict[str, dict[str, Any]],
+    *,
+    text: str | None = None,
+) -> bytes:
+    """Surgically edit a YAML file to insert/replace enrichment fields.
+
+    ``text`` is the file's current content; when omitted, ``yaml_path`` is
+    read. The file is replaced atomically. Returns the bytes written.
+    """
+    if text is None:
+        text = yaml_path.read_bytes().decode("utf-8")
+    lines = text.splitlines()
+    new_content = _render_changes(lines, changes)
+    write_atomic(yaml_path, new_content)
+    return new_content
 
 
 # ---------------------------------------------------------------------------
@@ -1645,15 +1563,20 @@ def apply_changes(
 # ---------------------------------------------------------------------------
 
 
-def validate_yaml(yaml_path: Path) -> bool:
-    """Validate that a YAML file still parses correctly after editing."""
+def validate_yaml_text(text: str | bytes) -> bool:
+    """Validate that edited YAML content still parses as a table YAML."""
     try:
-        data = yaml.safe_load(yaml_path.read_text())
+        data = yaml.load(text, Loader=SafeLoader)
         return bool(data) and "table" in data
     except yaml.YAMLError:
         return False
 
 
+def validate_yaml(yaml_path: Path) -> bool:
+    """Validate that a YAML file still parses correctly after editing."""
+    return validate_yaml_text(yaml_path.read_bytes())
+
+
 # ---------------------------------------------------------------------------
 # Statistics
 # ---------------------------------------------------------------------------
@@ -1661,28 +1584,96 @@ def validate_yaml(yaml_path: Path) -> bool:
 
 def count_coverage(yaml_path: Path) -> dict[str, int]:
     """Count enrichment coverage for a single YAML file."""
-    data = yaml.safe_load(yaml_path.read_text())
+    data = _load_yaml(yaml_path)
     columns = data.get("table", {}).get("columns", [])
-    total = len(columns)
-    has_desc = 0
-    has_source = 0
-    has_synonyms = 0
+    return {
+        "total": len(columns),
+        "descriptions": sum(
+            1 for c in columns if (d := c.get("description")) and str(d).strip()
+        ),
+        "sources": sum(1 for c in columns if c.get("source")),
+        "synonyms": sum(1 for c in columns if c.get("synonyms") is not None),
+    }
 
-    for col in columns:
-        desc = col.get("description", "")
-        if desc and str(desc).strip() != "":
-            has_desc += 1
-        if col.get("source"):
-            has_source += 1
-        if col.get("synonyms") is not None:
-            has_synonyms += 1
 
-    return {
-        "total": total,
-        "descriptions": has_desc,
-        "sources": has_source,
-        "synonyms": has_synonyms,
+# ---------------------------------------------------------------------------
+# Per-table pipeline
+# ---------------------------------------------------------------------------
+
+# Metadata maps and lookup cache, installed by _init_worker (once per worker)
+_worker_state: tuple[dict[Any, Any], ...] = ()
+
+
+def _process_one_table(
+    table_name: str,
+    yaml_path: Path,
+    omx_ref: dict[str, dict[str, dict[str, Any]]],
+    transform_map: dict[str, dict[str, dict[str, Any]]],
+    proto_desc_map: dict[str, dict[str, Any]],
+    proto_to_bq: dict[str, dict[str, Any]],
+    cache: dict[tuple[str, ...], str | None],
+    dry_run: bool,
+) -> tuple[dict[str, int], dict[int, int], bool]:
+    """Generate, validate and apply the changes for one table YAML.
+
+    The edited content is validated in memory and only written when it still
+    parses, so a bad edit never reaches disk.
+
+    Returns (change counts by field, description counts by tier, valid).
+    """
+    data = _load_yaml(yaml_path)
+
+    changes = generate_changes(
+        table_name, data, omx_ref, transform_map, proto_desc_map, proto_to_bq, cache
+    )
+
+    # Count changes by type and descriptions by tier in one pass
+    stats = {
+        "descriptions": 0,
+        "sources": 0,
+        "synonyms": 0,
+        "business_rules": 0,
+        "related_columns": 0,
     }
+    tiers = {1: 0, 2: 0, 3: 0}
+    for c in changes.values():
+        if "description" in c:
+            stats["descriptions"] += 1
+        if "source" in c:
+            stats["sources"] += 1
+        if "synonyms" in c:
+            stats["synonyms"] += 1
+        if "business_rules" in c:
+            stats["business_rules"] += 1
+        if "related_columns" in c:
+            stats["related_columns"] += 1
+        t = c.get("_tier")
+        if t in tiers:
+            tiers[t] += 1
+
+    if not changes or dry_run:
+        return stats, tiers, True
+
+    # Only tables that are being edited need their raw text
+    text = yaml_path.read_text(encoding="utf-8")
+    new_content = _render_changes(text.splitlines(), changes)
+    if not validate_yaml_text(new_content):
+        return stats, tiers, False
+    write_atomic(yaml_path, new_content)
+    return stats, tiers, True
+
+
+def _init_worker(*state: dict[Any, Any]) -> None:
+    """Install the shared metadata maps and lookup cache in a worker process."""
+    global _worker_state
+    _worker_state = state
+
+
+def _process_table_in_worker(
+    table_name: str, yaml_path: Path, dry_run: bool
+) -> tuple[dict[str, int], dict[int, int], bool]:
+    """Run _process_one_table against the state installed by _init_worker."""
+    return _process_one_table(table_name, yaml_path, *_worker_state, dry_run)
 
 
 # ---------------------------------------------------------------------------
@@ -1696,8 +1687,13 @@ def main(
     table: str | None = None,
     *,
     all_markets: bool = False,
+    workers: int | None = 1,
 ) -> dict[str, dict]:
-    """Run description enrichment across catalog YAMLs."""
+    """Run description enrichment across catalog YAMLs.
+
+    ``workers`` > 1 spreads the reference parse and the per-table work over
+    that many processes (``None`` means CPU count).
+    """
 
     print("=" * 70)
     print("Column Description Enrichment")
@@ -1706,12 +1702,13 @@ def main(
 
     # Load metadata indexes
     print("Loading metadata indexes...")
-    proto_messages = _load_proto_fields()
+    if not yaml.__with_libyaml__:
+        print("  NOTE: PyYAML has no libyaml bindings; YAML parsing will be slow")
+    proto_messages, proto_to_bq = _load_proto_yaml()
     proto_desc_map = build_proto_description_map(proto_messages)
-    proto_to_bq = _load_proto_to_bq()
     transforms = _load_transforms()
     transform_map = build_transform_map(transforms)
-    omx_ref = build_omx_reference()
+    omx_ref = build_omx_reference(workers)
 
     print(f"  Proto messages: {len(proto_messages)}")
     print(f"  Proto field descriptions: {len(proto_desc_map)}")
@@ -1731,13 +1728,13 @@ def main(
     # These are in MARKET_TABLES["omx_data"] but combined_tables() skips omx_data
     # because they live under catalog/data/, not catalog/omx_data/.
     if all_markets and "data" in target_tables:
-        omx_extra = MARKET_TABLES.get("omx_data", [])
-        core_data = set(ALL_TABLES.get("data", []))
-        extra = [t for t in omx_extra if t not in core_data]
+        extra = frozenset(MARKET_TABLES.get("omx_data", ())).difference(
+            ALL_TABLES.get("data", ())
+        )
         if table:
-            extra = [t for t in extra if t == table]
+            extra &= {table}
         if extra:
-            target_tables["data"] = list(set(target_tables["data"]) | set(extra))
+            target_tables["data"] = sorted(extra.union(target_tables["data"]))
 
     all_stats: dict[str, dict] = {}
     grand_total_desc = 0
@@ -1748,90 +1745,88 @@ def main(
     tier_counts = {1: 0, 2: 0, 3: 0}
     validation_failures: list[str] = []
 
-    for lyr, tables in sorted(target_tables.items()):
-        print(f"--- {lyr} ---")
-
-        for table_name in sorted(tables):
-            yaml_path = CATALOG_DIR / lyr / f"{table_name}.yaml"
-            if not yaml_path.exists():
-                print(f"  SKIP: {yaml_path.name} not found")
-                continue
+    layer_paths = {
+        lyr: [(t, CATALOG_DIR / lyr / f"{t}.yaml") for t in sorted(tables)]
+        for lyr, tables in sorted(target_tables.items())
+    }
+    found = [
+        (table_name, yaml_path)
+        for paths in layer_paths.values()
+        for table_name, yaml_path in paths
+        if yaml_path.exists()
+    ]
+    found_paths = {yaml_path for _, yaml_path in found}
+    # Tier 2/source lookups for this run; each pool worker fills its own copy
+    lookup_cache: dict[tuple[str, ...], str | None] = {}
+    outcomes = map_tables(
+        _process_table_in_worker,
+        [(table_name, yaml_path, dry_run) for table_name, yaml_path in found],
+        workers,
+        initializer=_init_worker,
+        initargs=(omx_ref, transform_map, proto_desc_map, proto_to_bq, lookup_cache),
+    )
 
-            key = f"{lyr}/{table_name}"
+    try:
+        # The per-table report is buffered and written once per layer, so large
+        # layers cost one stdout write instead of one or two per table
+        for lyr, paths in layer_paths.items():
+            report = [f"--- {lyr} ---"]
+
+            for table_name, yaml_path in paths:
+                if yaml_path not in found_paths:
+                    report.append(f"  SKIP: {yaml_path.name} not found")
+                    continue
 
-            # Generate changes
-            changes = generate_changes(
-                table_name,
-                yaml_path,
-                omx_ref,
-                transform_map,
-                proto_desc_map,
-                proto_to_bq,
-            )
+                key = f"{lyr}/{table_name}"
+                stats, tiers, valid = next(outcomes)
+                all_stats[key] = stats
 
-            if not changes:
-                all_stats[key] = {
-                    "descriptions": 0,
-                    "sources": 0,
-                    "synonyms": 0,
-                    "business_rules": 0,
-                    "related_columns": 0,
-                }
-                print(f"  {table_name}: no changes needed")
-                continue
+                if not any(stats.values()):
+                    report.append(f"  {table_name}: no changes needed")
+                    continue
 
-            # Count changes by type
-            desc_count = sum(1 for c in changes.values() if "description" in c)
-            source_count = sum(1 for c in changes.values() if "source" in c)
-            synonym_count = sum(1 for c in changes.values() if "synonyms" in c)
-            rules_count = sum(1 for c in changes.values() if "business_rules" in c)
-            related_count = sum(1 for c in changes.values() if "related_columns" in c)
-
-            # Count tiers
-            for c in changes.values():
-                t = c.get("_tier")
-                if t in tier_counts:
-                    tier_counts[t] += 1
-
-            stats = {
-                "descriptions": desc_count,
-                "sources": source_count,
-                "synonyms": synonym_count,
-                "business_rules": rules_count,
-                "related_columns": related_count,
-            }
-            all_stats[key] = stats
-
-            grand_total_desc += desc_count
-            grand_total_source += source_count
-            grand_total_synonyms += synonym_count
-            grand_total_rules += rules_count
-            grand_total_related += related_count
-
-            parts = []
-            if desc_count:
-                parts.append(f"desc={desc_count}")
-            if source_count:
-                parts.append(f"src={source_count}")
-            if synonym_count:
-                parts.append(f"syn={synonym_count}")
-            if rules_count:
-                parts.append(f"rules={rules_count}")
-            if related_count:
-                parts.append(f"related={related_count}")
-
-            action = "WOULD" if dry_run else "APPLIED"
-            print(f"  {table_name}: {action} {', '.join(parts)}")
-
-            if not dry_run:
-                apply_changes(yaml_path, changes)
-
-                # Validate the result
-                if not validate_yaml(yaml_path):
+                desc_count = stats["descriptions"]
+                source_count = stats["sources"]
+                synonym_count = stats["synonyms"]
+                rules_count = stats["business_rules"]
+                related_count = stats["related_columns"]
+
+                for t, count in tiers.items():
+                    tier_counts[t] += count
+
+                grand_total_desc += desc_count
+                grand_total_source += source_count
+                grand_total_synonyms += synonym_count
+                grand_total_rules += rules_count
+                grand_total_related += related_count
+
+                parts = []
+                if desc_count:
+                    parts.append(f"desc={desc_count}")
+                if source_count:
+                    parts.append(f"src={source_count}")
+                if synonym_count:
+                    parts.append(f"syn={synonym_count}")
+                if rules_count:
+                    parts.append(f"rules={rules_count}")
+                if related_count:
+                    parts.append(f"related={related_count}")
+
+                action = "WOULD" if dry_run else "APPLIED"
+                report.append(f"  {table_name}: {action} {', '.join(parts)}")
+
+                if not valid:
                     validation_failures.append(key)
-                    print(f"    WARNING: YAML validation failed for {key}!")
+                    report.append(
+                        f"    WARNING: YAML validation failed for {key}! File left unchanged."
+                    )
 
-        print()
+            report.append("")
+            sys.stdout.write("\n".join(report) + "\n")
+    finally:
+        # A serial run installs the maps in this process; do not keep them
+        # alive after main() returns
+        _init_worker()
 
     # Summary
     print("=" * 70)
@@ -1879,10 +1874,12 @@ if __name__ == "__main__":
         action="store_true",
         help="Include all market directories",
     )
+    add_workers_argument(parser)
     args = parser.parse_args()
     main(
         dry_run=args.dry_run,
         layer=args.layer,
         table=args.table,
         all_markets=args.all_markets,
+        workers=args.workers,
     )
@@ -25,6 +25,13 @@ METADATA_DIR = PROJECT_ROOT / "metadata"
 CATALOG_DIR = PROJECT_ROOT / "catalog"
 KPI_COMPUTATIONS_PATH = METADATA_DIR / "kpi_computations.yaml"
 
+from enrich_common import (
+    SafeLoader,
+    add_workers_argument,
+    index_by_name,
+    map_tables,
+    write_atomic,
+)
 from table_registry import KPI_TABLES
 
 # ---------------------------------------------------------------------------
@@ -34,8 +41,8 @@ from table_registry import KPI_TABLES
 
 def load_kpi_computations(path: Path) -> dict:
     """Load and parse kpi_computations.yaml."""
-    with open(path) as f:
-        return yaml.safe_load(f)
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader)
 
 
 def get_all_intervals(computations: dict) -> list[str]:
@@ -68,8 +75,10 @@ def _resolve_formula(
     if isinstance(formula, str) and formula.startswith("See shared_formulas."):
         ref_name = formula.split(".")[-1]
         shared = shared_formulas.get(ref_name, {})
-        # Use standard variant
-        return shared.get("standard", shared.get(trade_type))
+        # Use standard variant, falling back to the trade-type variant
+        if "standard" in shared:
+            return shared["standard"]
+        return shared.get(trade_type)
 
     if formula is not None:
         # Normalize multiline YAML strings
@@ -83,18 +92,28 @@ def _resolve_formula(
     return None
 
 
-def _find_trade_type(computations: dict, name: str) -> dict | None:
-    """Find a trade type entry by name in kpi_computations."""
-    for tt in computations.get("trade_types", []):
-        if tt["name"] == name:
-            return tt
-    return None
+def _expand_intervals(
+    index: dict[str, str],
+    name_template: str,
+    formula: str,
+    intervals: list[str],
+) -> None:
+    """Add one index entry per interval, substituting ``{interval}``.
+
+    Both templates are split on the placeholder once and re-joined with each
+    interval, instead of rescanning them with ``str.replace`` per interval.
+    """
+    name_parts = name_template.split("{interval}")
+    formula_parts = formula.split("{interval}")
+    for interval in intervals:
+        index[interval.join(name_parts)] = interval.join(formula_parts)
 
 
 def build_formula_index(
     computations: dict,
     trade_type: str,
     intervals: list[str],
+    trade_types: dict[str, dict] | None = None,
 ) -> dict[str, str]:
     """Build a {column_name: formula} lookup for a given trade type.
 
@@ -102,10 +121,16 @@ def build_formula_index(
     - Direct metrics and intermediate calculations
     - Per-interval expansion ({interval} → concrete interval names)
     - Shared formula resolution (adjusted_tv, vol_path_estimate)
+
+    ``trade_types`` is ``index_by_name(computations["trade_types"])``; pass
+    it when building indexes for several trade types from the same
+    computations.
     """
     index: dict[str, str] = {}
     shared_formulas = computations.get("shared_formulas", {})
-    tt = _find_trade_type(computations, trade_type)
+    if trade_types is None:
+        trade_types = index_by_name(computations.get("trade_types", []))
+    tt = trade_types.get(trade_type)
     if tt is None:
         return index
 
@@ -118,18 +143,10 @@ def build_formula_index(
             if formula is None:
                 continue
 
-            if entry.get("per_interval"):
-                # Expand to all intervals
-                for interval in intervals:
-                    col_name = name_template.replace("{interval}", interval)
-                    expanded = formula.replace("{interval}", interval)
-                    index[col_name] = expanded
-            elif "{interval}" in name_template:
-                # Template name but not marked per_interval — expand anyway
-                for interval in intervals:
-                    col_name = name_template.replace("{interval}", interval)
-                    expanded = formula.replace("{interval}", interval)
-                    index[col_name] = expanded
+            # Expand per_interval entries, and template names not marked
+            # per_interval, to all intervals
+            if entry.get("per_interval") or "{interval}" in name_template:
+                _expand_intervals(index, name_template, formula, intervals)
             else:
                 index[name_template] = formula
 
@@ -139,16 +156,15 @@ def build_formula_index(
         # Skip if already handled via metrics (e.g., adjusted_tv is referenced
         # from metrics entries). Only handle formulas with per-trade-type
         # variants that aren't referenced elsewhere.
-        if isinstance(sf_data, dict) and trade_type in sf_data:
-            template_formula = sf_data[trade_type]
+        template_formula = (
+            sf_data.get(trade_type) if isinstance(sf_data, dict) else None
+        )
+        if template_formula is not None:
             template_col = f"{sf_name}_{{interval}}"
             # Only add if not already present from metrics/intermediates
             test_name = f"{sf_name}_1s"
             if test_name not in index:
-                for interval in intervals:
-                    col_name = template_col.replace("{interval}", interval)
-                    expanded = template_formula.replace("{interval}", interval)
-                    index[col_name] = expanded
+                _expand_intervals(index, template_col, template_formula, intervals)
 
     return index
 
@@ -206,10 +222,18 @@ def enrich_table_yaml(
 # ---------------------------------------------------------------------------
 
 
+# Patterns used per formula and per line, compiled once for every table
+_NEWLINE_WS_RE = re.compile(r"\s*\n\s*")
+_WS_RE = re.compile(r"\s+")
+# Only run on lines containing "- name: "; most lines are rejected by that
+# substring test without entering the regex engine
+_COL_RE = re.compile(r"^(\s+)- name: (.+?)(\s*#.*)?$")
+
+
 def _quote_for_yaml(formula: str) -> str:
     """Quote a formula string for safe single-line YAML scalar output."""
     # Collapse any embedded newlines + surrounding whitespace to a single space
-    formula = re.sub(r"\s*\n\s*", " ", formula).strip()
+    formula = _NEWLINE_WS_RE.sub(" ", formula).strip()
     if "'" in formula:
         escaped = formula.replace('"', '\\"')
         return f'"{escaped}"'
@@ -217,16 +241,15 @@ def _quote_for_yaml(formula: str) -> str:
 
 
 def _build_change_list(
-    yaml_path: Path,
+    data: dict,
     formula_index: dict[str, str],
 ) -> tuple[dict[str, tuple[str, str]], dict[str, int]]:
-    """Determine formula changes needed without modifying the file.
+    """Determine formula changes needed for a parsed table YAML.
 
     Returns:
         (changes, stats) where changes is ``{col_name: (action, formula)}``
         and action is ``'add'`` or ``'update'``.
     """
-    data = yaml.safe_load(yaml_path.read_text())
     changes: dict[str, tuple[str, str]] = {}
     stats: dict[str, int] = {
         "added": 0,
@@ -244,12 +267,12 @@ def _build_change_list(
         existing = col.get("formula")
 
         # Normalize whitespace for comparison (source may have newlines)
-        normalized_source = re.sub(r"\s+", " ", source_formula).strip()
+        normalized_source = _WS_RE.sub(" ", source_formula).strip()
 
         if existing is None:
             changes[col_name] = ("add", source_formula)
             stats["added"] += 1
-        elif re.sub(r"\s+", " ", str(existing)).strip() != normalized_source:
+        elif _WS_RE.sub(" ", str(existing)).strip() != normalized_source:
             changes[col_name] = ("update", source_formula)
             stats["updated"] += 1
         else:
@@ -261,67 +284,111 @@ def _build_change_list(
 def _apply_changes_to_file(
     yaml_path: Path,
     changes: dict[str, tuple[str, str]],
+    *,
+    text: str | None = None,
 ) -> None:
     """Surgically apply formula additions/updates to a YAML file.
 
     Only modifies formula lines; all other content is preserved byte-for-byte.
+    ``text`` is the file's current content; when omitted, ``yaml_path`` is
+    read. The file is left untouched when there are no changes.
     """
-    lines = yaml_path.read_text().splitlines()
+    if not changes:
+        return
+    if text is None:
+        text = yaml_path.read_bytes().decode("utf-8")
+    lines = text.splitlines()
     result: list[str] = []
     current_col: str | None = None
+    # Whether current_col has a change, looked up once at its header line
+    col_has_change = False
     handled: set[str] = set()
     field_indent = "    "
-    i = 0
+    # Set while dropping the continuation lines of a replaced formula
+    skip_indent: str | None = None
+    # Unchanged lines are copied to result in runs: lines[emit_start:i] are
+    # the lines seen since the last edit that still have to be copied
+    emit_start = 0
+
+    for i, line in enumerate(lines):
+        # Skip continuation lines of old value (block scalars or plain
+        # scalars that wrap to the next line).  Continuation lines are
+        # indented deeper than the key.
+        if skip_indent is not None:
+            if line.startswith(skip_indent):
+                continue
+            skip_indent = None
+            emit_start = i
 
-    while i < len(lines):
-        line = lines[i]
+        # Every change has been applied: the rest of the file is copied as is
+        if len(handled) == len(changes):
+            break
 
         # Detect start of a new column block (flexible indent)
-        col_match = re.match(r"^(\s+)- name: (.+?)(\s*#.*)?$", line)
+        col_match = _COL_RE.match(line) if "- name: " in line else None
         if col_match:
             # Insert formula for previous column if it needed one
-            if (
-                current_col is not None
-                and current_col in changes
-                and current_col not in handled
-            ):
+            if col_has_change and current_col not in handled:
                 _, formula = changes[current_col]
+                result.extend(lines[emit_start:i])
                 result.append(f"{field_indent}formula: {_quote_for_yaml(formula)}")
+                emit_start = i
                 handled.add(current_col)
 
             col_indent = col_match.group(1)
             field_indent = col_indent + "  "
             current_col = col_match.group(2).strip()
+            col_has_change = current_col in changes
 
         # Detect and replace existing formula line (flexible indent)
-        formula_match = re.match(r"^(\s+)formula:", line)
-        if formula_match and current_col in changes:
+        if (
+            col_has_change
+            and line[:1].isspace()
+            and line.lstrip().startswith("formula:")
+        ):
             _, new_formula = changes[current_col]
+            result.extend(lines[emit_start:i])
             result.append(f"{field_indent}formula: {_quote_for_yaml(new_formula)}")
+            emit_start = i + 1
             handled.add(current_col)
-            i += 1
-
-            # Skip continuation lines of old value (block scalars or
-            # plain scalars that wrap to the next line).  Continuation
-            # lines are indented deeper than the key.
-            cont_indent = field_indent + "  "
-            while i < len(lines) and lines[i].startswith(cont_indent):
-                i += 1
-            continue
+            skip_indent = field_indent + "  "
 
-        result.append(line)
-        i += 1
+    # Copy the remaining lines, unless the file ended inside a replaced
+    # formula's continuation lines
+    if skip_indent is None:
+        result.extend(lines[emit_start:])
 
     # Handle the very last column in the file
-    if (
-        current_col is not None
-        and current_col in changes
-        and current_col not in handled
-    ):
+    if col_has_change and current_col not in handled:
         _, formula = changes[current_col]
         result.append(f"{field_indent}formula: {_quote_for_yaml(formula)}")
 
-    yaml_path.write_text("\n".join(result) + "\n")
+    write_atomic(yaml_path, ("\n".join(result) + "\n").encode())
+
+
+# ---------------------------------------------------------------------------
+# Per-table pipeline
+# ---------------------------------------------------------------------------
+
+
+def _process_table(
+    yaml_path: Path,
+    formula_index: dict[str, str],
+    dry_run: bool,
+) -> dict[str, int]:
+    """Build and (unless ``dry_run``) apply the formula changes for one table.
+
+    Returns the table's stats.
+    """
+    # Read the file once: the bytes are parsed here and, if there are
+    # changes, decoded for the surgical edit
+    content = yaml_path.read_bytes()
+    data = yaml.load(content, Loader=SafeLoader)
+    changes, stats = _build_change_list(data, formula_index)
+
+    if not dry_run and changes:
+        _apply_changes_to_file(yaml_path, changes, text=content.decode("utf-8"))
+    return stats
 
 
 # ---------------------------------------------------------------------------
@@ -332,29 +399,48 @@ def _apply_changes_to_file(
 def main(
     dry_run: bool = False,
     table: str | None = None,
+    *,
+    workers: int | None = 1,
 ) -> dict[str, dict[str, int]]:
     """Run formula enrichment across KPI tables.
 
+    ``workers`` > 1 spreads the tables over that many processes (``None``
+    means CPU count).
+
     Returns:
         ``{table_name: stats_dict}`` for each table processed.
     """
     computations = load_kpi_computations(KPI_COMPUTATIONS_PATH)
     intervals = get_all_intervals(computations)
+    trade_types = index_by_name(computations.get("trade_types", []))
     all_stats: dict[str, dict[str, int]] = {}
-    target_tables = [t for t in KPI_TABLES if t == table] if table else KPI_TABLES
+    if table:
+        target_tables = [table] if table in KPI_TABLES else []
+    else:
+        target_tables = KPI_TABLES
+
+    table_paths = {t: CATALOG_DIR / "kpi" / f"{t}.yaml" for t in target_tables}
+    found = [t for t, yaml_path in table_paths.items() if yaml_path.exists()]
+    found_tables = set(found)
+    outcomes = map_tables(
+        _process_table,
+        [
+            (
+                table_paths[t],
+                build_formula_index(computations, t, intervals, trade_types),
+                dry_run,
+            )
+            for t in found
+        ],
+        workers,
+    )
 
-    for table_name in target_tables:
-        yaml_path = CATALOG_DIR / "kpi" / f"{table_name}.yaml"
-        if not yaml_path.exists():
+    for table_name, yaml_path in table_paths.items():
+        if table_name not in found_tables:
             print(f"SKIP: {yaml_path} not found")
             continue
 
-        formula_index = build_formula_index(computations, table_name, intervals)
-        changes, stats = _build_change_list(yaml_path, formula_index)
-
-        if not dry_run and changes:
-            _apply_changes_to_file(yaml_path, changes)
-
+        stats = next(outcomes)
         all_stats[table_name] = stats
 
         print(
@@ -376,5 +462,6 @@ if __name__ == "__main__":
         "--dry-run", action="store_true", help="Report changes without writing"
     )
     parser.add_argument("--table", help="Filter to one table name")
+    add_workers_argument(parser)
     args = parser.parse_args()
-    main(dry_run=args.dry_run, table=args.table)
+    main(dry_run=args.dry_run, table=args.table, workers=args.workers)
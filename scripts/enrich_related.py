@@ -11,6 +11,7 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
 import re
 from pathlib import Path
 
@@ -23,6 +24,7 @@ import yaml
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 CATALOG_DIR = PROJECT_ROOT / "catalog"
 
+from enrich_common import SafeLoader, add_workers_argument, map_tables, write_atomic
 from table_registry import ALL_TABLES, filter_combined_tables, filter_tables
 
 MAX_RELATED = 5
@@ -101,6 +103,9 @@ _SQL_KEYWORDS = frozenset(
         "NULL_BUYSELL",
     }
 )
+# Formula identifiers are almost always lowercase, so matching against the
+# lowercased keywords needs no case conversion for most tokens
+_SQL_KEYWORDS_LOWER = frozenset(k.lower() for k in _SQL_KEYWORDS)
 
 
 # ---------------------------------------------------------------------------
@@ -108,26 +113,59 @@ _SQL_KEYWORDS = frozenset(
 # ---------------------------------------------------------------------------
 
 
+# Patterns used per formula and per line, compiled once for every table
+# String literals match without a group, so only identifiers are captured
+_TOKEN_RE = re.compile(r"""'[^']*'|"[^"]*"|\b([a-zA-Z_][a-zA-Z0-9_]*)\b""")
+# Only run on lines containing "- name: "; most lines are rejected by that
+# substring test without entering the regex engine
+_COL_RE = re.compile(r"^(\s+)- name: (.+?)(\s*#.*)?$")
+
+
 def extract_formula_references(formula: str) -> set[str]:
     """Extract potential column name references from a SQL formula.
 
     Returns a set of identifier-like tokens that are not SQL keywords,
     string literals, or numeric literals.
     """
-    # Remove string literals (single and double quoted)
-    cleaned = re.sub(r"'[^']*'", "", formula)
-    cleaned = re.sub(r'"[^"]*"', "", cleaned)
+    return set(_formula_references(formula))
 
-    # Extract word tokens (identifiers)
-    tokens = re.findall(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\b", cleaned)
 
-    # Filter out SQL keywords and functions (case-insensitive)
-    refs = set()
-    for token in tokens:
-        if token.upper() not in _SQL_KEYWORDS and not token.isdigit():
-            refs.add(token)
+@functools.lru_cache(maxsize=4096)
+def _formula_references(formula: str) -> frozenset[str]:
+    """Cached core of extract_formula_references.
 
-    return refs
+    Per-interval columns repeat the same formulas, so results are cached per
+    formula string; the set is frozen because it is shared between callers.
+    """
+    # One scan skips string literals (single and double quoted) and picks
+    # out identifier tokens, then SQL keywords and functions are dropped
+    # (case-insensitive)
+    refs = set()
+    for match in _TOKEN_RE.finditer(formula):
+        token = match.group(1)
+        if not token or token in _SQL_KEYWORDS_LOWER:
+            continue
+        # Only tokens with uppercase letters need lowering to compare
+        if not token.islower() and token.lower() in _SQL_KEYWORDS_LOWER:
+            continue
+        refs.add(token)
+
+    return frozenset(refs)
+
+
+def _same_table_refs(
+    formula: str, all_col_names: frozenset[str], col_name: str
+) -> list[str]:
+    """Sorted formula references that are other columns of the same table."""
+    # One pass over the (few) references; set arithmetic here would copy
+    # the table's whole column name set for every column
+    return sorted(
+        [
+            ref
+            for ref in _formula_references(formula)
+            if ref in all_col_names and ref != col_name
+        ]
+    )
 
 
 def enrich_table_related(
@@ -140,7 +178,7 @@ def enrich_table_related(
 
     # Build set of all column names in this table
     columns = data.get("table", {}).get("columns", [])
-    all_col_names = {c["name"] for c in columns}
+    all_col_names = frozenset(c["name"] for c in columns)
 
     for col in columns:
         # Skip if already has related_columns
@@ -153,8 +191,7 @@ def enrich_table_related(
             continue
 
         # Extract references and filter to same-table columns
-        refs = extract_formula_references(formula)
-        related = sorted(refs & all_col_names - {col["name"]})
+        related = _same_table_refs(formula, all_col_names, col["name"])
 
         if not related:
             continue
@@ -173,15 +210,14 @@ def enrich_table_related(
 
 
 def _build_related_changes(
-    yaml_path: Path,
+    data: dict,
 ) -> tuple[dict[str, list[str]], dict]:
-    """Determine related_columns changes without modifying the file."""
-    data = yaml.safe_load(yaml_path.read_text())
+    """Determine related_columns changes for a parsed table YAML."""
     changes: dict[str, list[str]] = {}
     stats = {"assigned": 0, "preserved": 0}
 
     columns = data.get("table", {}).get("columns", [])
-    all_col_names = {c["name"] for c in columns}
+    all_col_names = frozenset(c["name"] for c in columns)
 
     for col in columns:
         if col.get("related_columns") is not None:
@@ -192,8 +228,7 @@ def _build_related_changes(
         if not formula:
             continue
 
-        refs = extract_formula_references(formula)
-        related = sorted(refs & all_col_names - {col["name"]})
+        related = _same_table_refs(formula, all_col_names, col["name"])
 
         if related:
             changes[col["name"]] = related[:MAX_RELATED]
@@ -205,9 +240,17 @@ def _build_related_changes(
 def _apply_related_changes(
     yaml_path: Path,
     changes: dict[str, list[str]],
+    *,
+    text: str | None = None,
 ) -> None:
-    """Surgically insert related_columns fields into a YAML file."""
-    lines = yaml_path.read_text().splitlines()
+    """Surgically insert related_columns fields into a YAML file.
+
+    ``text`` is the file's current content; when omitted, ``yaml_path`` is
+    read.
+    """
+    if text is None:
+        text = yaml_path.read_bytes().decode("utf-8")
+    lines = text.splitlines()
     result: list[str] = []
     current_col: str | None = None
     handled: set[str] = set()
@@ -215,7 +258,7 @@ def _apply_related_changes(
     field_indent = "    "
 
     for line in lines:
-        col_match = re.match(r"^(\s+)- name: (.+?)(\s*#.*)?$", line)
+        col_match = _COL_RE.match(line) if "- name: " in line else None
         if col_match:
             in_columns = True
             _flush_related(result, current_col, changes, handled, field_indent)
@@ -233,7 +276,7 @@ def _apply_related_changes(
         result.append(line)
 
     _flush_related(result, current_col, changes, handled, field_indent)
-    yaml_path.write_text("\n".join(result) + "\n")
+    write_atomic(yaml_path, ("\n".join(result) + "\n").encode())
 
 
 def _flush_related(
@@ -252,6 +295,25 @@ def _flush_related(
     handled.add(current_col)
 
 
+# ---------------------------------------------------------------------------
+# Per-table pipeline
+# ---------------------------------------------------------------------------
+
+
+def _process_table(yaml_path: Path, dry_run: bool) -> dict:
+    """Build and (unless ``dry_run``) apply related_columns for one table.
+
+    Returns the table's stats.
+    """
+    content = yaml_path.read_bytes()
+    data = yaml.load(content, Loader=SafeLoader)
+    changes, stats = _build_related_changes(data)
+
+    if not dry_run and changes:
+        _apply_related_changes(yaml_path, changes, text=content.decode("utf-8"))
+    return stats
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -263,31 +325,38 @@ def main(
     table: str | None = None,
     *,
     all_markets: bool = False,
+    workers: int | None = 1,
 ) -> dict[str, dict]:
-    """Run related columns enrichment across table YAMLs."""
+    """Run related columns enrichment across table YAMLs.
+
+    ``workers`` > 1 spreads the tables over that many processes (``None``
+    means CPU count).
+    """
     all_stats: dict[str, dict] = {}
     if all_markets or (layer and layer not in ALL_TABLES):
         target_tables = filter_combined_tables(layer, table, include_markets=True)
     else:
         target_tables = filter_tables(layer, table) if (layer or table) else ALL_TABLES
 
-    for layer, tables in target_tables.items():
-        for table_name in tables:
-            yaml_path = CATALOG_DIR / layer / f"{table_name}.yaml"
-            if not yaml_path.exists():
-                print(f"SKIP: {yaml_path} not found")
-                continue
-
-            changes, stats = _build_related_changes(yaml_path)
+    table_paths = [
+        (f"{lyr}/{table_name}", CATALOG_DIR / lyr / f"{table_name}.yaml")
+        for lyr, tables in target_tables.items()
+        for table_name in tables
+    ]
+    found = [yaml_path for _, yaml_path in table_paths if yaml_path.exists()]
+    found_paths = set(found)
+    outcomes = map_tables(
+        _process_table, [(yaml_path, dry_run) for yaml_path in found], workers
+    )
 
-            if not dry_run and changes:
-                _apply_related_changes(yaml_path, changes)
+    for key, yaml_path in table_paths:
+        if yaml_path not in found_paths:
+            print(f"SKIP: {yaml_path} not found")
+            continue
 
-            key = f"{layer}/{table_name}"
-            all_stats[key] = stats
-            print(
-                f"{key}: assigned={stats['assigned']}, preserved={stats['preserved']}"
-            )
+        stats = next(outcomes)
+        all_stats[key] = stats
+        print(f"{key}: assigned={stats['assigned']}, preserved={stats['preserved']}")
 
     return all_stats
 
@@ -306,10 +375,12 @@ if __name__ == "__main__":
     parser.add_argument(
         "--all-markets", action="store_true", help="Include all market directories"
     )
+    add_workers_argument(parser)
     args = parser.parse_args()
     main(
         dry_run=args.dry_run,
         layer=args.layer,
         table=args.table,
         all_markets=args.all_markets,
+        workers=args.workers,
     )
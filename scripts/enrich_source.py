@@ -10,8 +10,10 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
 import re
 from pathlib import Path
+from typing import Any
 
 import yaml
 
@@ -23,6 +25,7 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 CATALOG_DIR = PROJECT_ROOT / "catalog"
 METADATA_DIR = PROJECT_ROOT / "metadata"
 
+from enrich_common import SafeLoader, index_by_name
 from table_registry import ALL_TABLES, filter_combined_tables, filter_tables
 
 # Kafka/infrastructure columns that don't come from proto definitions
@@ -38,6 +41,30 @@ _KAFKA_FIELDS = frozenset(
 )
 
 
+# ---------------------------------------------------------------------------
+# Metadata loading
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_metadata(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse one version of a metadata YAML, identified by (path, mtime, size)."""
+    with open(path_str, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _load_metadata(name: str) -> Any:
+    """Load a YAML from METADATA_DIR, reusing the parse while it is unchanged.
+
+    onboard_table runs main once per table, so without this the large
+    metadata files would be parsed again on every call. The returned
+    structure is shared between calls and must be treated as read-only.
+    """
+    path = METADATA_DIR / name
+    st = path.stat()
+    return _parse_metadata(str(path), st.st_mtime_ns, st.st_size)
+
+
 # ---------------------------------------------------------------------------
 # Proto column mapping
 # ---------------------------------------------------------------------------
@@ -47,18 +74,18 @@ def build_proto_column_map(
     table_name: str,
     transforms: dict,
     proto_to_bq: dict,
+    tables_by_name: dict[str, dict] | None = None,
 ) -> dict[str, str]:
     """Build a mapping of BQ column name → proto source string.
 
     Uses data_loader_transforms.yaml to find the source_field for each column,
-    then maps to the proto message from proto_to_bq.
+    then maps to the proto message from proto_to_bq. ``tables_by_name`` is
+    ``index_by_name(transforms["tables"])``; pass it when mapping many tables.
     """
     # Find the table in transforms
-    table_info = None
-    for t in transforms.get("tables", []):
-        if t["name"] == table_name:
-            table_info = t
-            break
+    if tables_by_name is None:
+        tables_by_name = index_by_name(transforms.get("tables", []))
+    table_info = tables_by_name.get(table_name)
 
     if table_info is None:
         return {}
@@ -115,10 +142,16 @@ def build_proto_column_map(
 # ---------------------------------------------------------------------------
 
 
-def build_kpi_source_map(table_name: str, kpi_yaml: dict) -> dict[str, str]:
+def build_kpi_source_map(
+    table_name: str,
+    kpi_yaml: dict,
+    trade_types_by_name: dict[str, dict] | None = None,
+) -> dict[str, str]:
     """Build source mapping for KPI columns from kpi_computations.yaml.
 
     Handles both dict-style (test fixtures) and list-style (real YAML) structures.
+    For list-style trade types, ``trade_types_by_name`` is
+    ``index_by_name(kpi_yaml["trade_types"])``; pass it when mapping many tables.
     """
     result: dict[str, str] = {}
 
@@ -132,11 +165,9 @@ def build_kpi_source_map(table_name: str, kpi_yaml: dict) -> dict[str, str]:
     trade_types = kpi_yaml.get("trade_types", {})
 
     if isinstance(trade_types, list):
-        trade_type = {}
-        for tt in trade_types:
-            if tt.get("name") == table_name:
-                trade_type = tt
-                break
+        if trade_types_by_name is None:
+            trade_types_by_name = index_by_name(trade_types)
+        trade_type = trade_types_by_name.get(table_name, {})
     elif isinstance(trade_types, dict):
         trade_type = trade_types.get(table_name, {})
     else:
@@ -208,7 +239,8 @@ def _build_source_changes(
     source_map: dict[str, str],
 ) -> tuple[dict[str, str], dict]:
     """Determine source field changes without modifying the file."""
-    data = yaml.safe_load(yaml_path.read_text())
+    with yaml_path.open("rb") as f:
+        data = yaml.load(f, Loader=SafeLoader)
     changes: dict[str, str] = {}
     stats = {"assigned": 0, "preserved": 0}
 
@@ -293,12 +325,16 @@ def main(
 ) -> dict[str, dict]:
     """Run source field enrichment across table YAMLs."""
     # Load metadata indexes
-    transforms = yaml.safe_load(
-        (METADATA_DIR / "data_loader_transforms.yaml").read_text()
-    )
-    proto_data = yaml.safe_load((METADATA_DIR / "proto_fields.yaml").read_text())
+    transforms = _load_metadata("data_loader_transforms.yaml")
+    proto_data = _load_metadata("proto_fields.yaml")
     proto_to_bq = proto_data.get("proto_to_bq", {})
-    kpi_data = yaml.safe_load((METADATA_DIR / "kpi_computations.yaml").read_text())
+    kpi_data = _load_metadata("kpi_computations.yaml")
+    # Name indexes over the metadata lists, built once for all tables
+    tables_by_name = index_by_name(transforms.get("tables", []))
+    trade_types = kpi_data.get("trade_types", {})
+    trade_types_by_name = (
+        index_by_name(trade_types) if isinstance(trade_types, list) else None
+    )
 
     all_stats: dict[str, dict] = {}
     if all_markets or (layer and layer not in ALL_TABLES):
@@ -317,11 +353,17 @@ def main(
             # Market directories (e.g. arb_data, brazil_data) use data-layer mappings
             if layer == "kpi":
                 # KPI layer: combine proto origins + KPI computation sources
-                source_map = build_proto_column_map(table_name, transforms, proto_to_bq)
-                kpi_sources = build_kpi_source_map(table_name, kpi_data)
+                source_map = build_proto_column_map(
+                    table_name, transforms, proto_to_bq, tables_by_name
+                )
+                kpi_sources = build_kpi_source_map(
+                    table_name, kpi_data, trade_types_by_name
+                )
                 source_map.update(kpi_sources)
             else:
-                source_map = build_proto_column_map(table_name, transforms, proto_to_bq)
+                source_map = build_proto_column_map(
+                    table_name, transforms, proto_to_bq, tables_by_name
+                )
 
             key = f"{layer}/{table_name}"
 
@@ -331,7 +373,8 @@ def main(
                 continue
 
             if dry_run:
-                data = yaml.safe_load(yaml_path.read_text())
+                with yaml_path.open("rb") as f:
+                    data = yaml.load(f, Loader=SafeLoader)
                 _, stats = enrich_table_source(data, source_map, return_stats=True)
             else:
                 changes, stats = _build_source_changes(yaml_path, source_map)
@@ -25,6 +25,7 @@ import sys
 from pathlib import Path
 
 import yaml
+from enrich_common import SafeLoader
 from table_registry import ALL_TABLES, filter_tables
 
 # ---------------------------------------------------------------------------
@@ -87,7 +88,8 @@ def step_update_dataset_yaml(layer: str, table: str, *, dry_run: bool = False) -
         print(f"  [registry] SKIP: {dataset_path} not found")
         return False
 
-    data = yaml.safe_load(dataset_path.read_text())
+    with dataset_path.open("rb") as f:
+        data = yaml.load(f, Loader=SafeLoader)
     tables_list = data.get("dataset", {}).get("tables", [])
 
     if table in tables_list:
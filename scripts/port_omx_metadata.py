@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 import yaml
+from enrich_common import wrap_words
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -158,16 +159,10 @@ def format_yaml_value(key: str, value: Any, indent_level: int) -> list[str]:
             desc_str = str(value).strip()
             if "\n" in desc_str or len(desc_str) > 80:
                 # Multi-line: first chunk on same line as key, rest indented
-                words = desc_str.split()
-                current_line = f"{prefix}description: {words[0]}"
                 continuation_prefix = " " * (indent_level + 2)
-                for word in words[1:]:
-                    if len(current_line) + 1 + len(word) <= 120:
-                        current_line += " " + word
-                    else:
-                        lines.append(current_line)
-                        current_line = continuation_prefix + word
-                lines.append(current_line)
+                lines.extend(
+                    wrap_words(desc_str, f"{prefix}description: ", continuation_prefix)
+                )
             elif _needs_yaml_quoting(desc_str):
                 # Short description with YAML-sensitive characters -- quote it
                 # Use single quotes (escape internal single quotes by doubling them)
@@ -199,16 +194,10 @@ def format_yaml_value(key: str, value: Any, indent_level: int) -> list[str]:
             br_str = str(value).strip()
             if len(br_str) > 80:
                 lines.append(f"{prefix}business_rules: >-")
-                words = br_str.split()
                 continuation_prefix = " " * (indent_level + 2)
-                current_line = continuation_prefix + words[0]
-                for word in words[1:]:
-                    if len(current_line) + 1 + len(word) <= 120:
-                        current_line += " " + word
-                    else:
-                        lines.append(current_line)
-                        current_line = continuation_prefix + word
-                lines.append(current_line)
+                lines.extend(
+                    wrap_words(br_str, continuation_prefix, continuation_prefix)
+                )
             elif _needs_yaml_quoting(br_str):
                 escaped = br_str.replace("'", "''")
                 lines.append(f"{prefix}business_rules: '{escaped}'")
@@ -351,9 +351,8 @@ def filter_tables(
         if layer and lyr != layer:
             continue
         if table:
-            filtered = [t for t in tables if t == table]
-            if filtered:
-                result[lyr] = filtered
+            if table in tables:
+                result[lyr] = [table]
         else:
             result[lyr] = list(tables)
 
@@ -416,9 +415,8 @@ def filter_combined_tables(
         if layer and lyr != layer:
             continue
         if table:
-            filtered = [t for t in tables if t == table]
-            if filtered:
-                result[lyr] = filtered
+            if table in tables:
+                result[lyr] = [table]
         else:
             result[lyr] = list(tables)
 
@@ -442,9 +440,8 @@ def filter_market_tables(
         if market and mkt != market:
             continue
         if table:
-            filtered = [t for t in tables if t == table]
-            if filtered:
-                result[mkt] = filtered
+            if table in tables:
+                result[mkt] = [table]
         else:
             result[mkt] = list(tables)
 
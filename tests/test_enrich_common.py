@@ -0,0 +1,66 @@
+"""Tests for scripts/enrich_common.py — helpers shared by the enrich scripts."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure scripts/ is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from enrich_common import map_tables, wrap_words, write_atomic
+
+
+class TestWriteAtomic:
+    """Verify files are replaced whole or not at all."""
+
+    def test_replaces_content(self, tmp_path):
+        path = tmp_path / "t.yaml"
+        path.write_text("old\n")
+        write_atomic(path, b"new\n")
+        assert path.read_bytes() == b"new\n"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_failed_write_keeps_original(self, tmp_path, monkeypatch):
+        path = tmp_path / "t.yaml"
+        path.write_text("old\n")
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("enrich_common.os.replace", fail)
+        with pytest.raises(OSError):
+            write_atomic(path, b"new\n")
+        assert path.read_text() == "old\n"
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestMapTables:
+    """Verify results come back in job order, serially or in a pool."""
+
+    @pytest.mark.parametrize("workers", [1, 2, None])
+    def test_results_in_job_order(self, workers):
+        jobs = [(n, 2) for n in range(10)]
+        assert list(map_tables(pow, jobs, workers)) == [n**2 for n in range(10)]
+
+    def test_serial_runs_initializer_in_process(self):
+        seen = []
+        results = map_tables(abs, [(-1,)], 1, initializer=seen.append, initargs=("x",))
+        assert list(results) == [1]
+        assert seen == ["x"]
+
+
+class TestWrapWords:
+    """Verify greedy wrapping with the prefixes counted in the width."""
+
+    def test_wraps_between_words(self):
+        assert wrap_words("aaa bbb  ccc\nddd", "k: ", "  ", 11) == [
+            "k: aaa bbb",
+            "  ccc ddd",
+        ]
+
+    def test_long_word_not_split(self):
+        assert wrap_words("a-very-long-word x", "k: ", "  ", 8) == [
+            "k: a-very-long-word",
+            "  x",
+        ]
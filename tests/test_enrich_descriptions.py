@@ -0,0 +1,318 @@
+"""Tests for the column description enrichment script.
+
+Validates that scripts/enrich_descriptions.py correctly:
+- Generates Tier 3 descriptions from column naming patterns
+- Keeps pattern precedence (prefix rules win over later regex patterns)
+- Reuses Tier 2/source lookups through the per-run cache
+- Builds the OMX/KPI reference with data-layer columns taking priority
+- Surgically fills empty descriptions and missing fields in table YAMLs
+"""
+
+from __future__ import annotations
+
+import textwrap
+
+import pytest
+import scripts.enrich_descriptions as enrich_descriptions
+import yaml
+from scripts.enrich_descriptions import (
+    _process_one_table,
+    apply_changes,
+    build_omx_reference,
+    generate_changes,
+    generate_tier3_description,
+    main,
+    validate_yaml_text,
+)
+
+# ---------------------------------------------------------------------------
+# Test: Tier 3 name-pattern descriptions
+# ---------------------------------------------------------------------------
+
+
+class TestTier3Patterns:
+    """Verify the regex-driven Tier 3 branches."""
+
+    @pytest.mark.parametrize(
+        ("col_name", "expected"),
+        [
+            (
+                "strike_minus_3",
+                "Strike level at -3 normalized offset from ATM on the volatility surface.",
+            ),
+            (
+                "ivol_atm_1",
+                "Implied volatility at ATM offset 1 on the normalized strike surface.",
+            ),
+            (
+                "svol_plus_4",
+                "Smoothed volatility at +4 normalized strike offset from ATM.",
+            ),
+            (
+                "latency_stats_order_entry",
+                "Latency statistics for the order entry processing stage (nanoseconds).",
+            ),
+            (
+                "matching_engine_rx_timestamp_ns",
+                "Timestamp when the message was rxd at the matching engine (nanosecond component).",
+            ),
+            (
+                "egress_hardware_timestamp",
+                "Timestamp at hardware egress point.",
+            ),
+            (
+                "custom_greek_12",
+                "Custom Greek value #12, a user-defined sensitivity metric.",
+            ),
+            (
+                "ask_orders_2",
+                "Number of ask-side orders at level 2 of the order book.",
+            ),
+            (
+                "bid_price_01",
+                "Unadjusted bid-side price at level 1 of the order book.",
+            ),
+            ("depth_ask_volume_3", "Market depth ask-side volume at level 3."),
+            ("implied_bid_price_5", "Implied order book bid-side price at level 5."),
+            (
+                "vol_slippage_1m",
+                "Vol component of slippage at the 1m interval.",
+            ),
+        ],
+    )
+    def test_regex_patterns(self, col_name: str, expected: str):
+        assert generate_tier3_description(col_name, "FLOAT64") == expected
+
+    def test_exact_match_wins(self):
+        desc = generate_tier3_description("trade_date", "DATE")
+        assert desc is not None
+        assert desc.startswith("Trading session date")
+
+    def test_underlying_prefix_precedes_slippage_pattern(self):
+        desc = generate_tier3_description("underlying_slippage_1m", "FLOAT64")
+        assert desc == (
+            "Underlying instrument slippage 1m, mirrored from the parent "
+            "instrument definition."
+        )
+
+    def test_name_suffix_requires_string_type(self):
+        assert generate_tier3_description("side_name", "STRING") == (
+            "Human-readable name for the side enum value."
+        )
+        # Non-STRING *_name columns fall through to the later rules
+        assert generate_tier3_description("total_slippage_name", "INT64") == (
+            "Total component of slippage at the name interval."
+        )
+
+    def test_catch_all_uses_type_hint(self):
+        assert generate_tier3_description("some_thing", "FLOAT64") == (
+            "Some thing (numeric value)."
+        )
+        assert generate_tier3_description("some_thing", "GEOGRAPHY") == (
+            "Some thing (field)."
+        )
+
+    def test_no_pattern_returns_none(self):
+        assert generate_tier3_description("nounderscore", "STRING") is None
+
+
+# ---------------------------------------------------------------------------
+# Test: per-run lookup cache
+# ---------------------------------------------------------------------------
+
+
+class TestLookupCache:
+    """Verify Tier 2/source lookups go through the cache passed in."""
+
+    _DATA = {"table": {"columns": [{"name": "venue", "description": "Venue."}]}}
+    _TRANSFORMS = {
+        "trades": {"venue": {"source_field": "venue", "transformation": "direct"}}
+    }
+
+    def test_cached_source_reused(self):
+        cache = {("source", "trades", "venue"): "cached source"}
+        changes = generate_changes(
+            "trades", self._DATA, {}, self._TRANSFORMS, {}, {}, cache
+        )
+        assert changes["venue"]["source"] == "cached source"
+
+    def test_lookups_recorded_in_cache(self):
+        cache = {}
+        changes = generate_changes(
+            "trades", self._DATA, {}, self._TRANSFORMS, {}, {}, cache
+        )
+        assert changes["venue"]["source"] == "kafka infrastructure"
+        assert cache[("source", "trades", "venue")] == "kafka infrastructure"
+
+    def test_empty_type_accepted(self):
+        data = {
+            "table": {
+                "columns": [
+                    {"name": "venue", "type": None, "description": "V.", "source": "s"}
+                ]
+            }
+        }
+        assert generate_changes("trades", data, {}, {}, {}, {}, {}) == {}
+
+
+# ---------------------------------------------------------------------------
+# Test: OMX/KPI reference builder
+# ---------------------------------------------------------------------------
+
+
+def _write_ref_yaml(path, columns):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump({"table": {"name": "trades", "columns": columns}}))
+
+
+class TestOmxReference:
+    """Verify the reference merge is the same serially and in a process pool."""
+
+    @pytest.fixture
+    def ref_dirs(self, tmp_path, monkeypatch):
+        data_dir = tmp_path / "data"
+        kpi_dir = tmp_path / "kpi"
+        monkeypatch.setattr("scripts.enrich_descriptions.OMX_DATA_DIR", data_dir)
+        monkeypatch.setattr("scripts.enrich_descriptions.KPI_DIR", kpi_dir)
+        _write_ref_yaml(
+            data_dir / "trades.yaml",
+            [
+                {"name": "price", "description": "Data price.", "synonyms": []},
+                {"name": "venue", "description": ""},
+            ],
+        )
+        _write_ref_yaml(
+            kpi_dir / "trades.yaml",
+            [
+                {"name": "price", "description": "KPI price."},
+                {"name": "edge", "description": "KPI edge.", "source": "derived"},
+            ],
+        )
+        _write_ref_yaml(
+            kpi_dir / "_index.yaml", [{"name": "skip", "description": "Skip."}]
+        )
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_data_layer_wins(self, ref_dirs, workers):
+        assert build_omx_reference(workers) == {
+            "trades": {
+                "price": {"description": "Data price."},
+                "edge": {"description": "KPI edge.", "source": "derived"},
+            }
+        }
+
+
+# ---------------------------------------------------------------------------
+# Test: surgical YAML editing
+# ---------------------------------------------------------------------------
+
+_TABLE_YAML = textwrap.dedent(
+    """\
+    table:
+      name: trades
+      columns:
+        - name: trade_id
+          type: STRING
+          description: ""
+        - name: venue
+          type: STRING
+          description: Exchange venue where the trade
+            was executed.
+          source: kafka infrastructure
+        - name: price
+          type: FLOAT64
+          description: Trade price.
+    """
+)
+
+
+class TestApplyChanges:
+    """Verify apply_changes only touches empty/missing enrichment fields."""
+
+    def test_fills_description_and_inserts_missing_fields(self, tmp_path):
+        yaml_path = tmp_path / "trades.yaml"
+        yaml_path.write_text(_TABLE_YAML)
+        changes = {
+            "trade_id": {"description": "Unique trade identifier.", "_tier": 3},
+            "venue": {"source": "ignored, already present"},
+            "price": {"synonyms": ["px"], "business_rules": "Always positive."},
+        }
+
+        written = apply_changes(yaml_path, changes)
+
+        assert written == yaml_path.read_bytes()
+        assert validate_yaml_text(written)
+        columns = {c["name"]: c for c in yaml.safe_load(written)["table"]["columns"]}
+        assert columns["trade_id"]["description"] == "Unique trade identifier."
+        assert columns["venue"]["description"] == (
+            "Exchange venue where the trade was executed."
+        )
+        assert columns["venue"]["source"] == "kafka infrastructure"
+        assert columns["price"]["synonyms"] == ["px"]
+        assert columns["price"]["business_rules"] == "Always positive."
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_uses_supplied_text(self, tmp_path):
+        yaml_path = tmp_path / "trades.yaml"
+        yaml_path.write_text("stale: true\n")
+
+        written = apply_changes(
+            yaml_path,
+            {"trade_id": {"description": "Unique trade identifier."}},
+            text=_TABLE_YAML,
+        )
+
+        data = yaml.safe_load(written)
+        assert data["table"]["columns"][0]["description"] == (
+            "Unique trade identifier."
+        )
+
+    def test_no_changes_round_trips(self, tmp_path):
+        yaml_path = tmp_path / "trades.yaml"
+        yaml_path.write_text(_TABLE_YAML)
+
+        assert apply_changes(yaml_path, {}) == _TABLE_YAML.encode()
+
+    def test_invalid_edit_is_not_written(self, tmp_path):
+        yaml_path = tmp_path / "trades.yaml"
+        yaml_path.write_text(_TABLE_YAML)
+        # An unbalanced leading quote renders as a broken scalar
+        omx_ref = {"trades": {"trade_id": {"description": '"Unterminated quote'}}}
+
+        stats, tiers, valid = _process_one_table(
+            "trades", yaml_path, omx_ref, {}, {}, {}, {}, dry_run=False
+        )
+
+        assert not valid
+        assert stats["descriptions"] == 1
+        assert tiers[1] == 1
+        assert yaml_path.read_text() == _TABLE_YAML
+
+    def test_validate_rejects_non_table_yaml(self):
+        assert not validate_yaml_text("columns: []\n")
+        assert not validate_yaml_text("table: [unclosed\n")
+
+
+# ---------------------------------------------------------------------------
+# Test: main
+# ---------------------------------------------------------------------------
+
+
+class TestMain:
+    """Verify a serial run does not keep the metadata maps alive."""
+
+    def test_serial_run_clears_worker_state(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("scripts.enrich_descriptions.CATALOG_DIR", tmp_path)
+        monkeypatch.setattr(
+            "scripts.enrich_descriptions.OMX_DATA_DIR", tmp_path / "data"
+        )
+        monkeypatch.setattr("scripts.enrich_descriptions.KPI_DIR", tmp_path / "kpi")
+        _write_ref_yaml(
+            tmp_path / "kpi" / "markettrade.yaml",
+            [{"name": "price", "type": "FLOAT64"}],
+        )
+
+        all_stats = main(dry_run=True, layer="kpi", table="markettrade")
+
+        assert list(all_stats) == ["kpi/markettrade"]
+        assert enrich_descriptions._worker_state == ()
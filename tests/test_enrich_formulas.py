@@ -16,6 +16,7 @@ import copy
 from pathlib import Path
 
 import pytest
+from scripts.enrich_common import index_by_name
 from scripts.enrich_formulas import (
     build_formula_index,
     enrich_table_yaml,
@@ -362,6 +363,17 @@ class TestFormulaIndexCompleteness:
             assert len(idx) > 0, f"Empty index for {tt}"
             assert "instant_edge" in idx, f"Missing instant_edge for {tt}"
 
+    def test_prebuilt_trade_type_index_matches(
+        self, computations, intervals, markettrade_index
+    ):
+        """A shared trade type index gives the same result as the default."""
+        trade_types = index_by_name(computations["trade_types"])
+        assert (
+            build_formula_index(computations, "markettrade", intervals, trade_types)
+            == markettrade_index
+        )
+        assert build_formula_index(computations, "nosuch", intervals, trade_types) == {}
+
     def test_formula_count_reasonable(self, markettrade_index):
         """markettrade should have 100+ formulas (metrics + intermediates * intervals)."""
         # 6 intermediates + ~20 non-interval metrics + ~12 interval metrics * 17 intervals
@@ -6,15 +6,19 @@ Validates that scripts/enrich_related.py correctly:
 - Caps at 5 related columns
 - Preserves existing related_columns
 - Is idempotent
+- Gives the same results serially and in a process pool
 """
 
 from __future__ import annotations
 
 import copy
 
+import pytest
+import yaml
 from scripts.enrich_related import (
     enrich_table_related,
     extract_formula_references,
+    main,
 )
 
 # ---------------------------------------------------------------------------
@@ -87,6 +91,12 @@ class TestExtractFormulaReferences:
         assert "mid_base_val" in refs
         assert "delta_adjusted_base_price" in refs
 
+    def test_result_is_a_fresh_set(self):
+        formula = "trade_price - tv_1s"
+        refs = extract_formula_references(formula)
+        refs.add("extra")
+        assert extract_formula_references(formula) == {"trade_price", "tv_1s"}
+
 
 # ---------------------------------------------------------------------------
 # Test: Table-level enrichment
@@ -195,3 +205,31 @@ class TestEnrichTableRelated:
         result1 = enrich_table_related(data)
         result2 = enrich_table_related(copy.deepcopy(result1))
         assert result1 == result2
+
+
+# ---------------------------------------------------------------------------
+# Test: Per-table pipeline
+# ---------------------------------------------------------------------------
+
+
+class TestMain:
+    """Verify main edits tables the same way serially and in a process pool."""
+
+    @pytest.fixture
+    def catalog_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("scripts.enrich_related.CATALOG_DIR", tmp_path)
+        (tmp_path / "kpi").mkdir()
+        for table_name in ("markettrade", "quotertrade"):
+            (tmp_path / "kpi" / f"{table_name}.yaml").write_text(
+                yaml.safe_dump(SAMPLE_TABLE, sort_keys=False)
+            )
+        return tmp_path
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_found_tables_enriched(self, catalog_dir, workers):
+        all_stats = main(layer="kpi", workers=workers)
+        assert list(all_stats) == ["kpi/markettrade", "kpi/quotertrade"]
+        assert all(s == {"assigned": 2, "preserved": 0} for s in all_stats.values())
+        data = yaml.safe_load((catalog_dir / "kpi" / "quotertrade.yaml").read_text())
+        edge = data["table"]["columns"][4]
+        assert edge["related_columns"] == ["trade_price", "tv"]
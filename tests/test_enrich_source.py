@@ -6,13 +6,16 @@ Validates that scripts/enrich_source.py correctly:
 - Maps KPI columns to kpi_computations references
 - Preserves existing source fields
 - Is idempotent
+- Reuses parsed metadata YAMLs until they change
 """
 
 from __future__ import annotations
 
 import copy
 
+from scripts.enrich_common import index_by_name
 from scripts.enrich_source import (
+    _load_metadata,
     build_kpi_source_map,
     build_proto_column_map,
     enrich_table_source,
@@ -127,6 +130,18 @@ class TestBuildProtoColumnMap:
         result = build_proto_column_map("nonexistent", {"tables": []}, {})
         assert result == {}
 
+    def test_prebuilt_table_index(self):
+        transforms = {
+            "tables": [
+                {"name": "markettrade", "columns": [{"name": "a", "source_field": "x"}]},
+                {"name": "markettrade", "columns": [{"name": "b", "source_field": "y"}]},
+            ]
+        }
+        tables_by_name = index_by_name(transforms["tables"])
+        result = build_proto_column_map("markettrade", transforms, {}, tables_by_name)
+        assert result == build_proto_column_map("markettrade", transforms, {})
+        assert result == {"a": "proto field: x"}
+
 
 # ---------------------------------------------------------------------------
 # KPI source mapping
@@ -240,3 +255,25 @@ class TestEnrichTableSource:
             copy.deepcopy(result1), source_map, return_stats=True
         )
         assert result1 == result2
+
+
+# ---------------------------------------------------------------------------
+# Metadata loading
+# ---------------------------------------------------------------------------
+
+
+class TestLoadMetadata:
+    """Verify metadata YAMLs are parsed once per file version."""
+
+    def test_unchanged_file_reused(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("scripts.enrich_source.METADATA_DIR", tmp_path)
+        (tmp_path / "meta.yaml").write_text("tables: []\n")
+        assert _load_metadata("meta.yaml") is _load_metadata("meta.yaml")
+
+    def test_rewritten_file_reparsed(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("scripts.enrich_source.METADATA_DIR", tmp_path)
+        path = tmp_path / "meta.yaml"
+        path.write_text("tables: []\n")
+        assert _load_metadata("meta.yaml") == {"tables": []}
+        path.write_text("tables: [markettrade]\n")
+        assert _load_metadata("meta.yaml") == {"tables": ["markettrade"]}